@@ -7,17 +7,58 @@ This tool works with potentially malformed JSON files by extracting only
 the schemas section and rebuilding a clean OpenAPI spec.
 """
 
+import gc
+import io
 import json
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 
+try:
+    import orjson  # optional: C-level JSON parse, 3-10x stdlib on big specs
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: streams the schemas section without a Python char loop
+except ImportError:
+    ijson = None
+
+# $ref prefix for component schemas; fixed length so names can be sliced off
+SCHEMA_REF_PREFIX = '#/components/schemas/'
+SCHEMA_REF_PREFIX_LEN = len(SCHEMA_REF_PREFIX)
+
+
+def _intern_keys(d: dict) -> dict:
+    """json.loads object_hook: intern dict keys so the tens of thousands of
+    repeated spec keys share one str object each (less RSS, pointer-equal
+    compares during the $ref walk)."""
+    return {sys.intern(k): v for k, v in d.items()}
+
+
+def extract_schemas_section(raw: bytes) -> dict:
+    """Extract only the schemas section from a potentially malformed OpenAPI file.
+
+    Takes the raw file bytes so the caller can read the file once and reuse
+    the buffer for the full-spec parse. With ijson installed the section is
+    streamed by a C parser; the character-by-character brace scan only runs
+    as the pure-Python fallback. Both paths salvage what they can from files
+    that are malformed past the schemas section.
+    """
+    if ijson is not None:
+        schemas = {}
+        try:
+            for name, schema_def in ijson.kvitems(io.BytesIO(raw), 'components.schemas'):
+                schemas[name] = schema_def
+        except ijson.IncompleteJSONError:
+            # Malformed tail: keep whatever parsed cleanly
+            pass
+        if schemas:
+            return schemas
+        raise ValueError('Could not find "schemas" section')
+
+    content = raw.decode('utf-8')
 
-def extract_schemas_section(filepath: str) -> dict:
-    """Extract only the schemas section from a potentially malformed OpenAPI file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     schemas_start = content.find('"schemas": {')
     if schemas_start < 0:
         raise ValueError('Could not find "schemas" section')
@@ -51,176 +92,173 @@ def extract_schemas_section(filepath: str) -> dict:
     
     schemas_json = schemas_part[:end_pos]
     wrapped = '{"schemas": ' + schemas_json + '}'
-    data = json.loads(wrapped)
+    if orjson is not None:
+        data = orjson.loads(wrapped)
+    else:
+        data = json.loads(wrapped, object_hook=_intern_keys)
     return data['schemas']
 
 
+# old_schema_name -> canonical_schema_name. Built once at import so repeated
+# calls (and callers importing this as a library) share one dict.
+_CONSOLIDATION_MAP = {
+    # Group 1: User Responses (9 duplicates)
+    'DisableUserResponseDto': 'CreateUserResponseDto',
+    'EnableUserResponseDto': 'CreateUserResponseDto',
+    'GetUserByShortUuidResponseDto': 'CreateUserResponseDto',
+    'GetUserByUsernameResponseDto': 'CreateUserResponseDto',
+    'GetUserByUuidResponseDto': 'CreateUserResponseDto',
+    'ResetUserTrafficResponseDto': 'CreateUserResponseDto',
+    'RevokeUserSubscriptionResponseDto': 'CreateUserResponseDto',
+    'UpdateUserResponseDto': 'CreateUserResponseDto',
+    
+    # Group 2: Delete Operations (8 duplicates)
+    'DeleteConfigProfileResponseDto': 'DeleteResponseDto',
+    'DeleteExternalSquadResponseDto': 'DeleteResponseDto',
+    'DeleteHostResponseDto': 'DeleteResponseDto',
+    'DeleteInfraProviderByUuidResponseDto': 'DeleteResponseDto',
+    'DeleteInternalSquadResponseDto': 'DeleteResponseDto',
+    'DeleteNodeResponseDto': 'DeleteResponseDto',
+    'DeleteSubscriptionTemplateResponseDto': 'DeleteResponseDto',
+    'DeleteUserResponseDto': 'DeleteResponseDto',
+    
+    # Group 3: Event Operations (8 duplicates)
+    'AddUsersToExternalSquadResponseDto': 'EventResponseDto',
+    'AddUsersToInternalSquadResponseDto': 'EventResponseDto',
+    'BulkAllResetTrafficUsersResponseDto': 'EventResponseDto',
+    'BulkAllUpdateUsersResponseDto': 'EventResponseDto',
+    'RemoveUsersFromExternalSquadResponseDto': 'EventResponseDto',
+    'RemoveUsersFromInternalSquadResponseDto': 'EventResponseDto',
+    'RestartAllNodesResponseDto': 'EventResponseDto',
+    'RestartNodeResponseDto': 'EventResponseDto',
+    
+    # Group 4: Bulk Operations Response (6 duplicates)
+    'BulkDeleteUsersByStatusResponseDto': 'BulkActionResponseDto',
+    'BulkDeleteUsersResponseDto': 'BulkActionResponseDto',
+    'BulkResetTrafficUsersResponseDto': 'BulkActionResponseDto',
+    'BulkRevokeUsersSubscriptionResponseDto': 'BulkActionResponseDto',
+    'BulkUpdateUsersResponseDto': 'BulkActionResponseDto',
+    'BulkUpdateUsersSquadsResponseDto': 'BulkActionResponseDto',
+    
+    # Group 5: Bulk Request (6 duplicates)
+    'BulkDeleteHostsRequestDto': 'BulkUuidsRequestDto',
+    'BulkDisableHostsRequestDto': 'BulkUuidsRequestDto',
+    'BulkEnableHostsRequestDto': 'BulkUuidsRequestDto',
+    'BulkResetTrafficUsersRequestDto': 'BulkUuidsRequestDto',
+    'BulkRevokeUsersSubscriptionRequestDto': 'BulkUuidsRequestDto',
+    
+    # Group 6: Hosts Response (6 duplicates)
+    'BulkDeleteHostsResponseDto': 'GetAllHostsResponseDto',
+    'BulkDisableHostsResponseDto': 'GetAllHostsResponseDto',
+    'BulkEnableHostsResponseDto': 'GetAllHostsResponseDto',
+    'SetInboundToManyHostsResponseDto': 'GetAllHostsResponseDto',
+    'SetPortToManyHostsResponseDto': 'GetAllHostsResponseDto',
+    
+    # Group 7: Token Responses (5 duplicates)
+    'OAuth2CallbackResponseDto': 'LoginResponseDto',
+    'RegisterResponseDto': 'LoginResponseDto',
+    'TelegramCallbackResponseDto': 'LoginResponseDto',
+    'VerifyPasskeyAuthenticationResponseDto': 'LoginResponseDto',
+    
+    # Group 8: Node Responses (5 duplicates)
+    'DisableNodeResponseDto': 'CreateNodeResponseDto',
+    'EnableNodeResponseDto': 'CreateNodeResponseDto',
+    'GetOneNodeResponseDto': 'CreateNodeResponseDto',
+    'UpdateNodeResponseDto': 'CreateNodeResponseDto',
+    
+    # Group 9: Empty Wrapper (4 duplicates)
+    'GetPasskeyAuthenticationOptionsResponseDto': 'GetPasskeyRegistrationOptionsResponseDto',
+    'VerifyPasskeyAuthenticationRequestDto': 'GetPasskeyRegistrationOptionsResponseDto',
+    'VerifyPasskeyRegistrationRequestDto': 'GetPasskeyRegistrationOptionsResponseDto',
+    
+    # Group 10: Subscription Info (4 duplicates)
+    'GetSubscriptionByShortUuidProtectedResponseDto': 'GetSubscriptionInfoResponseDto',
+    'GetSubscriptionByUsernameResponseDto': 'GetSubscriptionInfoResponseDto',
+    'GetSubscriptionByUuidResponseDto': 'GetSubscriptionInfoResponseDto',
+    
+    # Group 11: Snippet Operations (4 duplicates)
+    'CreateSnippetResponseDto': 'GetSnippetsResponseDto',
+    'DeleteSnippetResponseDto': 'GetSnippetsResponseDto',
+    'UpdateSnippetResponseDto': 'GetSnippetsResponseDto',
+    
+    # Group 12: HWID Devices (4 duplicates)
+    'CreateUserHwidDeviceResponseDto': 'GetUserHwidDevicesResponseDto',
+    'DeleteAllUserHwidDevicesResponseDto': 'GetUserHwidDevicesResponseDto',
+    'DeleteUserHwidDeviceResponseDto': 'GetUserHwidDevicesResponseDto',
+    
+    # Group 13: Billing Nodes (4 duplicates)
+    'CreateInfraBillingNodeResponseDto': 'GetInfraBillingNodesResponseDto',
+    'DeleteInfraBillingNodeByUuidResponseDto': 'GetInfraBillingNodesResponseDto',
+    'UpdateInfraBillingNodeResponseDto': 'GetInfraBillingNodesResponseDto',
+    
+    # Group 14: User Search (3 duplicates)
+    'GetUserByEmailResponseDto': 'GetUserByTelegramIdResponseDto',
+    'GetUserByTagResponseDto': 'GetUserByTelegramIdResponseDto',
+    
+    # Group 15: Templates (3 duplicates)
+    'CreateSubscriptionTemplateResponseDto': 'GetTemplateResponseDto',
+    'UpdateTemplateResponseDto': 'GetTemplateResponseDto',
+    
+    # Group 16: Config Profiles (3 duplicates)
+    'CreateConfigProfileResponseDto': 'GetConfigProfileByUuidResponseDto',
+    'UpdateConfigProfileResponseDto': 'GetConfigProfileByUuidResponseDto',
+    
+    # Group 17: Internal Squads (3 duplicates)
+    'CreateInternalSquadResponseDto': 'GetInternalSquadByUuidResponseDto',
+    'UpdateInternalSquadResponseDto': 'GetInternalSquadByUuidResponseDto',
+    
+    # Group 18: External Squads (3 duplicates)
+    'CreateExternalSquadResponseDto': 'GetExternalSquadByUuidResponseDto',
+    'UpdateExternalSquadResponseDto': 'GetExternalSquadByUuidResponseDto',
+    
+    # Group 19: Hosts (3 duplicates)
+    'CreateHostResponseDto': 'GetOneHostResponseDto',
+    'UpdateHostResponseDto': 'GetOneHostResponseDto',
+    
+    # Group 20: Infrastructure Providers (3 duplicates)
+    'CreateInfraProviderResponseDto': 'GetInfraProviderByUuidResponseDto',
+    'UpdateInfraProviderResponseDto': 'GetInfraProviderByUuidResponseDto',
+    
+    # Group 21: Billing History (3 duplicates)
+    'CreateInfraBillingHistoryRecordResponseDto': 'GetInfraBillingHistoryRecordsResponseDto',
+    'DeleteInfraBillingHistoryRecordByUuidResponseDto': 'GetInfraBillingHistoryRecordsResponseDto',
+    
+    # Group 22: Settings (2 duplicates)
+    'UpdateRemnawaveSettingsResponseDto': 'GetRemnawaveSettingsResponseDto',
+    
+    # Group 23: Passkeys (2 duplicates)
+    'DeletePasskeyResponseDto': 'GetAllPasskeysResponseDto',
+    
+    # Group 24: Tags (2 duplicates)
+    'GetAllHostTagsResponseDto': 'GetAllTagsResponseDto',
+    
+    # Group 25: Inbounds (2 duplicates)
+    'GetInboundsByProfileUuidResponseDto': 'GetAllInboundsResponseDto',
+    
+    # Group 26: Snippet Requests (2 duplicates)
+    'UpdateSnippetRequestDto': 'CreateSnippetRequestDto',
+    
+    # Group 27: Nodes (2 duplicates)
+    'ReorderNodeResponseDto': 'GetAllNodesResponseDto',
+    
+    # Group 28: Subscription Settings (2 duplicates)
+    'UpdateSubscriptionSettingsResponseDto': 'GetSubscriptionSettingsResponseDto',
+}
+
+
 def create_consolidation_map() -> dict:
     """
     Create consolidation map based on analyzed duplicate patterns.
     Maps: old_schema_name -> canonical_schema_name
     """
-    return {
-        # Group 1: User Responses (9 duplicates)
-        'DisableUserResponseDto': 'CreateUserResponseDto',
-        'EnableUserResponseDto': 'CreateUserResponseDto',
-        'GetUserByShortUuidResponseDto': 'CreateUserResponseDto',
-        'GetUserByUsernameResponseDto': 'CreateUserResponseDto',
-        'GetUserByUuidResponseDto': 'CreateUserResponseDto',
-        'ResetUserTrafficResponseDto': 'CreateUserResponseDto',
-        'RevokeUserSubscriptionResponseDto': 'CreateUserResponseDto',
-        'UpdateUserResponseDto': 'CreateUserResponseDto',
-        
-        # Group 2: Delete Operations (8 duplicates)
-        'DeleteConfigProfileResponseDto': 'DeleteResponseDto',
-        'DeleteExternalSquadResponseDto': 'DeleteResponseDto',
-        'DeleteHostResponseDto': 'DeleteResponseDto',
-        'DeleteInfraProviderByUuidResponseDto': 'DeleteResponseDto',
-        'DeleteInternalSquadResponseDto': 'DeleteResponseDto',
-        'DeleteNodeResponseDto': 'DeleteResponseDto',
-        'DeleteSubscriptionTemplateResponseDto': 'DeleteResponseDto',
-        'DeleteUserResponseDto': 'DeleteResponseDto',
-        
-        # Group 3: Event Operations (8 duplicates)
-        'AddUsersToExternalSquadResponseDto': 'EventResponseDto',
-        'AddUsersToInternalSquadResponseDto': 'EventResponseDto',
-        'BulkAllResetTrafficUsersResponseDto': 'EventResponseDto',
-        'BulkAllUpdateUsersResponseDto': 'EventResponseDto',
-        'RemoveUsersFromExternalSquadResponseDto': 'EventResponseDto',
-        'RemoveUsersFromInternalSquadResponseDto': 'EventResponseDto',
-        'RestartAllNodesResponseDto': 'EventResponseDto',
-        'RestartNodeResponseDto': 'EventResponseDto',
-        
-        # Group 4: Bulk Operations Response (6 duplicates)
-        'BulkDeleteUsersByStatusResponseDto': 'BulkActionResponseDto',
-        'BulkDeleteUsersResponseDto': 'BulkActionResponseDto',
-        'BulkResetTrafficUsersResponseDto': 'BulkActionResponseDto',
-        'BulkRevokeUsersSubscriptionResponseDto': 'BulkActionResponseDto',
-        'BulkUpdateUsersResponseDto': 'BulkActionResponseDto',
-        'BulkUpdateUsersSquadsResponseDto': 'BulkActionResponseDto',
-        
-        # Group 5: Bulk Request (6 duplicates)
-        'BulkDeleteHostsRequestDto': 'BulkUuidsRequestDto',
-        'BulkDisableHostsRequestDto': 'BulkUuidsRequestDto',
-        'BulkEnableHostsRequestDto': 'BulkUuidsRequestDto',
-        'BulkResetTrafficUsersRequestDto': 'BulkUuidsRequestDto',
-        'BulkRevokeUsersSubscriptionRequestDto': 'BulkUuidsRequestDto',
-        
-        # Group 6: Hosts Response (6 duplicates)
-        'BulkDeleteHostsResponseDto': 'GetAllHostsResponseDto',
-        'BulkDisableHostsResponseDto': 'GetAllHostsResponseDto',
-        'BulkEnableHostsResponseDto': 'GetAllHostsResponseDto',
-        'SetInboundToManyHostsResponseDto': 'GetAllHostsResponseDto',
-        'SetPortToManyHostsResponseDto': 'GetAllHostsResponseDto',
-        
-        # Group 7: Token Responses (5 duplicates)
-        'OAuth2CallbackResponseDto': 'LoginResponseDto',
-        'RegisterResponseDto': 'LoginResponseDto',
-        'TelegramCallbackResponseDto': 'LoginResponseDto',
-        'VerifyPasskeyAuthenticationResponseDto': 'LoginResponseDto',
-        
-        # Group 8: Node Responses (5 duplicates)
-        'DisableNodeResponseDto': 'CreateNodeResponseDto',
-        'EnableNodeResponseDto': 'CreateNodeResponseDto',
-        'GetOneNodeResponseDto': 'CreateNodeResponseDto',
-        'UpdateNodeResponseDto': 'CreateNodeResponseDto',
-        
-        # Group 9: Empty Wrapper (4 duplicates)
-        'GetPasskeyAuthenticationOptionsResponseDto': 'GetPasskeyRegistrationOptionsResponseDto',
-        'VerifyPasskeyAuthenticationRequestDto': 'GetPasskeyRegistrationOptionsResponseDto',
-        'VerifyPasskeyRegistrationRequestDto': 'GetPasskeyRegistrationOptionsResponseDto',
-        
-        # Group 10: Subscription Info (4 duplicates)
-        'GetSubscriptionByShortUuidProtectedResponseDto': 'GetSubscriptionInfoResponseDto',
-        'GetSubscriptionByUsernameResponseDto': 'GetSubscriptionInfoResponseDto',
-        'GetSubscriptionByUuidResponseDto': 'GetSubscriptionInfoResponseDto',
-        
-        # Group 11: Snippet Operations (4 duplicates)
-        'CreateSnippetResponseDto': 'GetSnippetsResponseDto',
-        'DeleteSnippetResponseDto': 'GetSnippetsResponseDto',
-        'UpdateSnippetResponseDto': 'GetSnippetsResponseDto',
-        
-        # Group 12: HWID Devices (4 duplicates)
-        'CreateUserHwidDeviceResponseDto': 'GetUserHwidDevicesResponseDto',
-        'DeleteAllUserHwidDevicesResponseDto': 'GetUserHwidDevicesResponseDto',
-        'DeleteUserHwidDeviceResponseDto': 'GetUserHwidDevicesResponseDto',
-        
-        # Group 13: Billing Nodes (4 duplicates)
-        'CreateInfraBillingNodeResponseDto': 'GetInfraBillingNodesResponseDto',
-        'DeleteInfraBillingNodeByUuidResponseDto': 'GetInfraBillingNodesResponseDto',
-        'UpdateInfraBillingNodeResponseDto': 'GetInfraBillingNodesResponseDto',
-        
-        # Group 14: User Search (3 duplicates)
-        'GetUserByEmailResponseDto': 'GetUserByTelegramIdResponseDto',
-        'GetUserByTagResponseDto': 'GetUserByTelegramIdResponseDto',
-        
-        # Group 15: Templates (3 duplicates)
-        'CreateSubscriptionTemplateResponseDto': 'GetTemplateResponseDto',
-        'UpdateTemplateResponseDto': 'GetTemplateResponseDto',
-        
-        # Group 16: Config Profiles (3 duplicates)
-        'CreateConfigProfileResponseDto': 'GetConfigProfileByUuidResponseDto',
-        'UpdateConfigProfileResponseDto': 'GetConfigProfileByUuidResponseDto',
-        
-        # Group 17: Internal Squads (3 duplicates)
-        'CreateInternalSquadResponseDto': 'GetInternalSquadByUuidResponseDto',
-        'UpdateInternalSquadResponseDto': 'GetInternalSquadByUuidResponseDto',
-        
-        # Group 18: External Squads (3 duplicates)
-        'CreateExternalSquadResponseDto': 'GetExternalSquadByUuidResponseDto',
-        'UpdateExternalSquadResponseDto': 'GetExternalSquadByUuidResponseDto',
-        
-        # Group 19: Hosts (3 duplicates)
-        'CreateHostResponseDto': 'GetOneHostResponseDto',
-        'UpdateHostResponseDto': 'GetOneHostResponseDto',
-        
-        # Group 20: Infrastructure Providers (3 duplicates)
-        'CreateInfraProviderResponseDto': 'GetInfraProviderByUuidResponseDto',
-        'UpdateInfraProviderResponseDto': 'GetInfraProviderByUuidResponseDto',
-        
-        # Group 21: Billing History (3 duplicates)
-        'CreateInfraBillingHistoryRecordResponseDto': 'GetInfraBillingHistoryRecordsResponseDto',
-        'DeleteInfraBillingHistoryRecordByUuidResponseDto': 'GetInfraBillingHistoryRecordsResponseDto',
-        
-        # Group 22: Settings (2 duplicates)
-        'UpdateRemnawaveSettingsResponseDto': 'GetRemnawaveSettingsResponseDto',
-        
-        # Group 23: Passkeys (2 duplicates)
-        'DeletePasskeyResponseDto': 'GetAllPasskeysResponseDto',
-        
-        # Group 24: Tags (2 duplicates)
-        'GetAllHostTagsResponseDto': 'GetAllTagsResponseDto',
-        
-        # Group 25: Inbounds (2 duplicates)
-        'GetInboundsByProfileUuidResponseDto': 'GetAllInboundsResponseDto',
-        
-        # Group 26: Snippet Requests (2 duplicates)
-        'UpdateSnippetRequestDto': 'CreateSnippetRequestDto',
-        
-        # Group 27: Nodes (2 duplicates)
-        'ReorderNodeResponseDto': 'GetAllNodesResponseDto',
-        
-        # Group 28: Subscription Settings (2 duplicates)
-        'UpdateSubscriptionSettingsResponseDto': 'GetSubscriptionSettingsResponseDto',
-    }
+    return _CONSOLIDATION_MAP
 
 
-def create_canonical_schemas(original_schemas: dict, consolidation_map: dict) -> dict:
-    """
-    Create new schemas dict with canonical names and new generic schemas.
-    """
-    # Get all canonical names from mapping
-    canonical_names = set(consolidation_map.values())
-    duplicates_to_remove = set(consolidation_map.keys())
-    
-    # Keep only canonical schemas
-    new_schemas = {}
-    for name, schema_def in original_schemas.items():
-        if name not in duplicates_to_remove:
-            new_schemas[name] = schema_def
-    
-    # Add new generic schemas based on patterns found
-    new_schemas['DeleteResponseDto'] = {
+# Generic replacement schemas for the consolidated groups, declared once at
+# module scope and assigned into each output spec by reference (they are
+# never mutated downstream).
+_GENERIC_SCHEMAS = {
+    'DeleteResponseDto': {
         "properties": {
             "response": {
                 "properties": {
@@ -232,9 +270,8 @@ def create_canonical_schemas(original_schemas: dict, consolidation_map: dict) ->
         },
         "required": ["response"],
         "type": "object"
-    }
-    
-    new_schemas['EventResponseDto'] = {
+    },
+    'EventResponseDto': {
         "properties": {
             "response": {
                 "properties": {
@@ -246,9 +283,8 @@ def create_canonical_schemas(original_schemas: dict, consolidation_map: dict) ->
         },
         "required": ["response"],
         "type": "object"
-    }
-    
-    new_schemas['BulkActionResponseDto'] = {
+    },
+    'BulkActionResponseDto': {
         "properties": {
             "response": {
                 "properties": {
@@ -260,9 +296,8 @@ def create_canonical_schemas(original_schemas: dict, consolidation_map: dict) ->
         },
         "required": ["response"],
         "type": "object"
-    }
-    
-    new_schemas['BulkUuidsRequestDto'] = {
+    },
+    'BulkUuidsRequestDto': {
         "properties": {
             "uuids": {
                 "items": {
@@ -274,46 +309,93 @@ def create_canonical_schemas(original_schemas: dict, consolidation_map: dict) ->
         },
         "required": ["uuids"],
         "type": "object"
-    }
-    
+    },
+}
+
+
+def create_canonical_schemas(original_schemas: dict, consolidation_map: dict) -> dict:
+    """
+    Create new schemas dict with canonical names and new generic schemas.
+    """
+    # The consolidation map itself answers "is this a duplicate" in O(1);
+    # no need to materialize key/value sets first.
+    #
+    # Structurally identical bodies are also collapsed onto a single shared
+    # dict object (keyed by a sort-stable serialization hash): the output
+    # JSON is unchanged, but peak memory shrinks and downstream equality
+    # checks degrade to identity comparisons.
+    if orjson is not None:
+        _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    else:
+        _dumps = lambda obj: json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    canonical_by_hash = {}
+    new_schemas = {}
+    for name, schema_def in original_schemas.items():
+        if name in consolidation_map:
+            continue
+        h = hash(_dumps(schema_def))
+        new_schemas[name] = canonical_by_hash.setdefault(h, schema_def)
+
+    # Add the generic schemas for the consolidated groups
+    new_schemas.update(_GENERIC_SCHEMAS)
+
     return new_schemas
 
 
 def replace_refs_in_spec(spec: dict, consolidation_map: dict) -> dict:
-    """Replace all $ref references to consolidated schemas throughout the spec."""
-    
-    def replace_in_value(value):
-        if isinstance(value, dict):
+    """Replace all $ref references to consolidated schemas throughout the spec.
+
+    Iterative worklist instead of recursion: no Python frame per node, and
+    scalars are never pushed at all.
+    """
+    # Every rewritable ref shares the 21-char '#/components/schemas/'
+    # prefix, so the lookup is keyed on the bare schema name: one cheap
+    # prefix check, then a hash over just the suffix instead of the full
+    # ref string. Values hold the complete replacement ref so no concat
+    # happens per hit; interning caches the hashes.
+    suffix_map = {sys.intern(old): sys.intern(SCHEMA_REF_PREFIX + new)
+                  for old, new in consolidation_map.items()}
+    get = suffix_map.get
+    stack = deque([spec])
+    while stack:
+        value = stack.pop()
+        if type(value) is dict:
             if '$ref' in value:
                 ref = value['$ref']
-                if ref.startswith('#/components/schemas/'):
-                    schema_name = ref.replace('#/components/schemas/', '')
-                    if schema_name in consolidation_map:
-                        value['$ref'] = f"#/components/schemas/{consolidation_map[schema_name]}"
+                if ref.startswith(SCHEMA_REF_PREFIX):
+                    new_ref = get(ref[SCHEMA_REF_PREFIX_LEN:])
+                    if new_ref is not None:
+                        value['$ref'] = new_ref
             else:
-                for k, v in value.items():
-                    value[k] = replace_in_value(v)
-        elif isinstance(value, list):
-            return [replace_in_value(item) for item in value]
-        
-        return value
-    
-    replace_in_value(spec)
+                stack.extend(v for v in value.values() if type(v) is dict or type(v) is list)
+        else:
+            stack.extend(item for item in value if type(item) is dict or type(item) is list)
     return spec
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 create_consolidated_schema.py <input_file> [output_file]", file=sys.stderr)
+        print("Usage: python3 create_consolidated_schema.py [--pretty] <input_file> [output_file]", file=sys.stderr)
         print("Example: python3 create_consolidated_schema.py api-2-2-0.json api-2-2-0-consolidated.json", file=sys.stderr)
         sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.json', '-consolidated.json')
+
+    pretty = '--pretty' in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a != '--pretty']
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else input_file.replace('.json', '-consolidated.json')
     
     try:
+        # The spec load builds millions of long-lived objects; cyclic GC
+        # passes over that tree mid-construction are pure overhead, so
+        # collection is paused until the phases below are done.
+        gc.disable()
+
         print(f"📂 Extracting schemas from: {input_file}")
-        original_schemas = extract_schemas_section(input_file)
+        # Read once; the same buffer feeds the schemas extraction and the
+        # full-spec parse below.
+        with open(input_file, 'rb') as f:
+            raw = f.read()
+        original_schemas = extract_schemas_section(raw)
         print(f"✓ Found {len(original_schemas)} schemas")
         
         print("\n🔍 Creating consolidation mapping...")
@@ -328,54 +410,59 @@ def main():
         print("\n📝 Creating consolidated schemas...")
         new_schemas = create_canonical_schemas(original_schemas, consolidation_map)
         print(f"✓ New schema count: {len(new_schemas)}")
+        original_count = len(original_schemas)
+        del original_schemas
         
         print("\n📖 Loading full OpenAPI spec...")
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Find last valid JSON brace
-        brace_count = 0
-        in_string = False
-        escape = False
-        last_valid = 0
-        
-        for i, char in enumerate(content):
-            if escape:
-                escape = False
-                continue
-            if char == '\\':
-                escape = True
-                continue
-            if char == '"':
-                in_string = not in_string
-                continue
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        last_valid = i + 1
-        
-        # Load truncated JSON
-        full_spec = json.loads(content[:last_valid])
+        # Parse the buffer read above; raw_decode tolerates trailing garbage
+        # by stopping at the end of the first valid document, which replaces
+        # the old Python-level brace scan over the whole file. orjson is
+        # strict about trailing bytes, so it only handles the clean-file
+        # fast path.
+        full_spec = None
+        if orjson is not None:
+            try:
+                full_spec = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        if full_spec is None:
+            full_spec, _ = json.JSONDecoder(object_hook=_intern_keys).raw_decode(raw.decode('utf-8'))
+        del raw
         
         print("🔄 Replacing all schema references...")
-        full_spec = replace_refs_in_spec(full_spec, consolidation_map)
-        
+        # Swap in the consolidated schemas before the walk: the old schemas
+        # subtree is discarded anyway, so the ref rewrite skips its nodes
+        # entirely instead of rewriting refs that are about to be dropped.
+        # new_schemas comes from a separate parse, so its refs are untouched
+        # either way, exactly as before.
         print("📝 Updating schemas in spec...")
+        old_schemas = full_spec.get('components', {}).pop('schemas', None)
+        full_spec = replace_refs_in_spec(full_spec, consolidation_map)
         full_spec['components']['schemas'] = new_schemas
+        del old_schemas
+        gc.enable()
+        gc.collect()
         
         print(f"\n💾 Writing consolidated spec to: {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(full_spec, f, indent=2, ensure_ascii=False)
+        # Compact by default: this output feeds the next pipeline stage, so
+        # indentation is pure encoder and parser overhead. --pretty opts
+        # back in for a human-readable artifact.
+        if orjson is not None:
+            # orjson serializes to bytes in C in one shot — no per-value
+            # Python encoder calls, and no str-to-utf8 pass on write
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(full_spec, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(full_spec, f, indent=2 if pretty else None,
+                          separators=None if pretty else (',', ':'), ensure_ascii=False)
         
         # Print summary
-        schemas_removed = len(original_schemas) - len(new_schemas)
-        reduction_pct = (schemas_removed / len(original_schemas)) * 100
+        schemas_removed = original_count - len(new_schemas)
+        reduction_pct = (schemas_removed / original_count) * 100
         
         print(f"\n✅ CONSOLIDATION COMPLETE")
-        print(f"   Original schemas:     {len(original_schemas)}")
+        print(f"   Original schemas:     {original_count}")
         print(f"   Consolidated schemas: {len(new_schemas)}")
         print(f"   Schemas removed:      {schemas_removed}")
         print(f"   Reduction:            {reduction_pct:.1f}%")
@@ -18,11 +18,100 @@ Features:
     - Outputs statistics and recommendations
 """
 
+import hashlib
 import json
+import mmap
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Below this many schemas, process startup and pickling outweigh the
+# parallel canonicalization win
+PARALLEL_CANON_THRESHOLD = 500
+
+
+def _shape_fingerprint(schema_def) -> tuple:
+    """
+    Cheap structural fingerprint: type, property names and required list.
+
+    Schemas that differ here cannot be identical, so any schema whose
+    fingerprint is unique skips the full canonical serialization and hash.
+    """
+    if not isinstance(schema_def, dict):
+        return (type(schema_def).__name__, str(schema_def))
+    return (
+        schema_def.get('type'),
+        tuple(sorted(schema_def.get('properties', {}))),
+        tuple(schema_def.get('required', ())),
+    )
+
+
+def _canonical_digest(schema_def: dict) -> bytes:
+    """Return the 16-byte blake2b digest of a schema's canonical JSON bytes."""
+    if orjson is not None:
+        # C encoder emits sorted-key bytes directly, skipping the str→bytes encode
+        canon = orjson.dumps(schema_def, default=str, option=orjson.OPT_SORT_KEYS)
+    else:
+        canon = json.dumps(schema_def, sort_keys=True, default=str, separators=(',', ':')).encode()
+    return hashlib.blake2b(canon, digest_size=16).digest()
+
+
+def _intern_keys(d: dict) -> dict:
+    """
+    json.loads object_hook that interns dict keys.
+
+    OpenAPI specs repeat the same keys ('type', 'properties', '$ref', ...)
+    tens of thousands of times and the decoder does not dedupe them; interning
+    makes each occurrence share one str object, cutting memory and making
+    later key comparisons pointer-equal.
+    """
+    return {sys.intern(k): v for k, v in d.items()}
+
+
+def parse_json(content):
+    """Parse a JSON document (str or bytes-like), preferring orjson over stdlib json."""
+    if orjson is not None:
+        if isinstance(content, mmap.mmap):
+            # orjson accepts memoryview, so the mapped pages are parsed in place
+            content = memoryview(content)
+        # orjson has no object_hook; it caches/interns short keys internally
+        return orjson.loads(content)
+    if isinstance(content, (mmap.mmap, memoryview)):
+        content = bytes(content)
+    return json.loads(content, object_hook=_intern_keys)
+
+
+def stream_schemas_section(filepath: Path) -> dict:
+    """
+    Stream the components.schemas object from disk with ijson.
+
+    The byte-level parsing happens in C (yajl), so the file is never loaded
+    into a Python string and no per-character Python loop runs. A truncated
+    tail is handled naturally: everything parsed before the error is kept.
+    """
+    schemas = {}
+    with open(filepath, 'rb') as f:
+        try:
+            for name, schema in ijson.kvitems(f, 'components.schemas'):
+                schemas[name] = schema
+        except ijson.IncompleteJSONError:
+            # Malformed/truncated file: return what was parsed so far
+            pass
+    return schemas
+
 
 def find_schemas_section(content: str) -> tuple[str, int]:
     """
@@ -80,29 +169,41 @@ def load_schemas(filepath: str) -> dict:
     
     print(f"📂 Reading file: {filepath}", file=sys.stderr)
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    file_size_mb = len(content) / (1024 * 1024)
-    print(f"📊 File size: {file_size_mb:.2f} MB", file=sys.stderr)
+    file_size = filepath.stat().st_size
+    if file_size == 0:
+        raise ValueError(f"File is empty: {filepath}")
+    print(f"📊 File size: {file_size / (1024 * 1024):.2f} MB", file=sys.stderr)
     
-    try:
-        # Try parsing the entire file first
-        spec = json.loads(content)
-        schemas = spec.get('components', {}).get('schemas', {})
-        print(f"✓ File parsed successfully (full JSON)", file=sys.stderr)
-    except json.JSONDecodeError:
-        print(f"⚠ Full JSON parse failed, attempting schema extraction...", file=sys.stderr)
-        
+    # Memory-map the file: the OS page cache backs the bytes, so no
+    # Python-owned copy of the whole document exists until decode
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
         try:
-            schemas_json, _ = find_schemas_section(content)
-            wrapped = '{"schemas": ' + schemas_json + '}'
-            data = json.loads(wrapped)
-            schemas = data['schemas']
-            print(f"✓ Schemas extracted successfully (partial extraction)", file=sys.stderr)
-        except (ValueError, json.JSONDecodeError) as e:
-            print(f"✗ Error: {e}", file=sys.stderr)
-            sys.exit(1)
+            # Try parsing the entire file first
+            spec = parse_json(mm)
+            schemas = spec.get('components', {}).get('schemas', {})
+            print(f"✓ File parsed successfully (full JSON)", file=sys.stderr)
+        except ValueError:
+            # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
+            print(f"⚠ Full JSON parse failed, attempting schema extraction...", file=sys.stderr)
+
+            try:
+                if ijson is not None:
+                    schemas = stream_schemas_section(filepath)
+                    if not schemas:
+                        raise ValueError('Could not find "schemas" section in JSON file')
+                    print(f"✓ Schemas extracted successfully (ijson streaming)", file=sys.stderr)
+                else:
+                    # Fallback when ijson is not installed: pure-Python brace
+                    # scanner, which needs the decoded text
+                    content = mm[:].decode('utf-8')
+                    schemas_json, _ = find_schemas_section(content)
+                    wrapped = '{"schemas": ' + schemas_json + '}'
+                    data = json.loads(wrapped, object_hook=_intern_keys)
+                    schemas = data['schemas']
+                    print(f"✓ Schemas extracted successfully (partial extraction)", file=sys.stderr)
+            except (ValueError, json.JSONDecodeError) as e:
+                print(f"✗ Error: {e}", file=sys.stderr)
+                sys.exit(1)
     
     return schemas
 
@@ -111,20 +212,53 @@ def find_duplicates(schemas: dict) -> tuple[dict, list]:
     """
     Find duplicate/identical schemas.
     
+    Schemas are grouped by a 16-byte blake2b digest of their canonical JSON
+    bytes instead of the canonical string itself, so the grouping dict holds
+    fixed-size keys rather than multi-KB JSON strings. Each duplicate entry
+    carries one representative schema object from its group, so downstream
+    reporting never re-parses or re-serializes the canonical form.
+    
     Returns:
-        Tuple of (schema_groups_dict, sorted_duplicates_list)
+        Tuple of (schema_groups_dict, sorted_duplicates_list) where each
+        duplicate entry is (count, names, representative_schema).
     """
     schema_groups = defaultdict(list)
+    representatives = {}
     
+    # Cheap pre-sweep: bucket by shape fingerprint first. Most schemas in a
+    # spec are unique by shape, and those never need the full canonical
+    # serialization + hash; the shape tuple itself is their group key.
+    shape_groups = defaultdict(list)
     for name, schema_def in schemas.items():
-        # Convert schema to JSON string for comparison
-        key = json.dumps(schema_def, sort_keys=True, default=str)
+        shape_groups[_shape_fingerprint(schema_def)].append(name)
+    
+    candidates = []
+    for shape, names in shape_groups.items():
+        if len(names) == 1:
+            schema_groups[shape] = names
+        else:
+            candidates.extend(names)
+    
+    # Canonicalization dominates CPU time and each schema is independent,
+    # so large candidate sets are hashed across cores; small ones stay
+    # serial to avoid process-pool overhead.
+    if len(candidates) >= PARALLEL_CANON_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            keys = list(executor.map(_canonical_digest, (schemas[n] for n in candidates), chunksize=64))
+    else:
+        keys = [_canonical_digest(schemas[name]) for name in candidates]
+    
+    for name, key in zip(candidates, keys):
+        schema_def = schemas[name]
+        if key not in representatives:
+            representatives[key] = schema_def
         schema_groups[key].append(name)
     
-    # Extract duplicates (groups with more than one schema)
+    # Extract duplicates (groups with more than one schema), decorated with
+    # the group size so neither the sort nor the report passes re-call len()
     duplicates = sorted(
-        [(v, k) for k, v in schema_groups.items() if len(v) > 1],
-        key=lambda x: len(x[0]),
+        [(len(v), v, representatives[k]) for k, v in schema_groups.items() if len(v) > 1],
+        key=itemgetter(0),
         reverse=True
     )
     
@@ -153,10 +287,8 @@ def print_duplicates(duplicates: list, max_groups: int = None) -> None:
     print("🔍 DUPLICATE SCHEMAS FOUND:")
     print("=" * 130)
     
-    for idx, (names, schema_json) in enumerate(duplicates[:max_groups] if max_groups else duplicates, 1):
-        schema_def = json.loads(schema_json)
-        
-        print(f"\n[GROUP {idx}] {len(names)} IDENTICAL MODELS")
+    for idx, (count, names, schema_def) in enumerate(duplicates[:max_groups] if max_groups else duplicates, 1):
+        print(f"\n[GROUP {idx}] {count} IDENTICAL MODELS")
         print(f"Models: {', '.join(sorted(names))}")
         
         # Show schema structure details
@@ -179,12 +311,13 @@ def print_duplicates(duplicates: list, max_groups: int = None) -> None:
         
         # Show schema definition preview
         schema_preview = json.dumps(schema_def, indent=2)
-        lines = schema_preview.split('\n')[:12]
+        all_lines = schema_preview.split('\n')
         print(f"\nSchema Definition (preview):")
-        for line in lines:
+        for line in all_lines[:12]:
             print(f"  {line}")
-        if len(schema_preview.split('\n')) > 12:
-            print(f"  ... ({len(schema_preview.split('\n')) - 12} more lines)")
+        extra = len(all_lines) - 12
+        if extra > 0:
+            print(f"  ... ({extra} more lines)")
         
         print("-" * 130)
 
@@ -198,20 +331,21 @@ def print_recommendations(duplicates: list) -> None:
     print("💡 CONSOLIDATION RECOMMENDATIONS")
     print("=" * 130)
     
-    # Categorize by group size
-    large_groups = [d for d in duplicates if len(d[0]) >= 5]
-    medium_groups = [d for d in duplicates if 3 <= len(d[0]) < 5]
-    small_groups = [d for d in duplicates if len(d[0]) == 2]
+    # Categorize by group size in one pass instead of three comprehensions
+    large_groups, medium_groups, small_groups = [], [], []
+    for d in duplicates:
+        n = d[0]
+        (large_groups if n >= 5 else medium_groups if n >= 3 else small_groups).append(d)
     
     if large_groups:
         print(f"\n🔴 HIGH PRIORITY (5+ duplicates):")
-        for names, _ in large_groups:
-            print(f"   • {len(names)} models can be consolidated: {names[0]}* (and {len(names)-1} others)")
+        for count, names, _ in large_groups:
+            print(f"   • {count} models can be consolidated: {names[0]}* (and {count-1} others)")
     
     if medium_groups:
         print(f"\n🟡 MEDIUM PRIORITY (3-4 duplicates):")
-        for names, _ in medium_groups:
-            print(f"   • {len(names)} models: {', '.join(names[:2])}...")
+        for count, names, _ in medium_groups:
+            print(f"   • {count} models: {', '.join(names[:2])}...")
     
     if small_groups:
         print(f"\n🟢 LOW PRIORITY (2 duplicates):")
@@ -240,28 +374,26 @@ def print_grouped_by_pattern(duplicates: list) -> None:
         "Other": []
     }
     
-    for names, schema_json in duplicates:
-        schema_def = json.loads(schema_json)
-        
+    for count, names, schema_def in duplicates:
         # Categorize by pattern
         if isinstance(schema_def.get('properties', {}).get('response'), dict):
             resp = schema_def['properties']['response']
             if resp.get('properties', {}).get('isDeleted'):
-                patterns["Delete Operations"].append((len(names), names))
+                patterns["Delete Operations"].append((count, names))
             elif resp.get('properties', {}).get('eventSent'):
-                patterns["Event Based"].append((len(names), names))
+                patterns["Event Based"].append((count, names))
             elif resp.get('properties', {}).get('affectedRows'):
-                patterns["Bulk Operations"].append((len(names), names))
+                patterns["Bulk Operations"].append((count, names))
             elif resp.get('properties', {}).get('accessToken'):
-                patterns["Token Responses"].append((len(names), names))
+                patterns["Token Responses"].append((count, names))
             elif not resp.get('properties'):
-                patterns["Empty Wrapper"].append((len(names), names))
+                patterns["Empty Wrapper"].append((count, names))
             elif isinstance(resp.get('items'), dict):
-                patterns["List Responses"].append((len(names), names))
+                patterns["List Responses"].append((count, names))
             else:
-                patterns["Other"].append((len(names), names))
+                patterns["Other"].append((count, names))
         else:
-            patterns["Other"].append((len(names), names))
+            patterns["Other"].append((count, names))
     
     for pattern_name, items in patterns.items():
         if items:
@@ -7,6 +7,7 @@ This script parses the OpenAPI spec and generates organized sub-clients for all
 
 import json
 import re
+from collections import defaultdict
 from pathlib import Path
 
 
@@ -76,17 +77,14 @@ def main():
         spec = json.load(f)
 
     paths = spec.get('paths', {})
-    operations_by_controller = {}
+    operations_by_controller = defaultdict(list)
 
     # Group operations by controller
     for path, methods in paths.items():
         for method, details in methods.items():
             if isinstance(details, dict) and 'operationId' in details:
                 tag = details.get('tags', ['Unknown'])[0]
-                
-                if tag not in operations_by_controller:
-                    operations_by_controller[tag] = []
-                
+
                 operations_by_controller[tag].append({
                     'operationId': details['operationId'],
                     'method': method.upper(),
@@ -6,58 +6,96 @@ Reads api-2-2-2-consolidated.json and oas_client_gen.go
 import json
 import re
 
-print("=" * 70)
-print("CLIENT_EXT.GO GENERATOR")
-print("=" * 70)
+try:
+    import orjson  # optional: C-level JSON parse, 3-10x stdlib on big specs
+except ImportError:
+    orjson = None
 
-# Step 1: Parse oas_client_gen.go for method signatures
-print("\n[1/4] Parsing oas_client_gen.go...")
-with open('api/oas_client_gen.go', 'r') as f:
-    content = f.read()
+try:
+    import ijson  # optional: streams just the paths section of the spec
+except ImportError:
+    ijson = None
 
-# Extract method signatures more carefully
-methods = {}
-# Match: func (c *Client) MethodName(ctx context.Context, ...) (...) {
-pattern = r'func \(c \*Client\) (\w+)\((ctx context\.Context(?:,\s*[^)]+)?)\)\s*\(([^)]+)\)'
 
-for match in re.finditer(pattern, content, re.MULTILINE):
-    method_name = match.group(1)
-    if method_name in ['requestURL', 'sendApiTokensControllerCreate']:  # Skip internal
-        continue
-    if method_name.startswith('send'):
-        continue
-    
-    full_params = match.group(2)  # "ctx context.Context, request *Type, params ParamsType"
-    returns = match.group(3)      # "TypeRes, error"
-    
-    # Parse params (skip ctx)
-    params_list = []
-    if ', ' in full_params:
-        params_str = full_params.split(', ', 1)[1]  # Remove "ctx context.Context"
-        # Split remaining params carefully
-        for param in re.findall(r'(\w+)\s+([\*\w\.]+)', params_str):
-            params_list.append((param[0], param[1]))
-    
-    # Parse returns
-    returns_list = [r.strip() for r in returns.split(',')]
-    
-    methods[method_name] = {
-        'params': params_list,
-        'returns': returns_list
-    }
+def _iter_paths(spec_file):
+    """Yield (path, path_item) pairs; only the paths branch is needed here.
 
-print(f"   ✓ Found {len(methods)} client methods")
+    With ijson the schemas section — which dominates spec size — is never
+    materialized at all.
+    """
+    if ijson is not None:
+        with open(spec_file, 'rb') as f:
+            yield from ijson.kvitems(f, 'paths')
+        return
+    with open(spec_file, 'rb') as f:
+        raw = f.read()
+    spec = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    yield from spec.get('paths', {}).items()
+
+# Compiled once at import: runs once per matched method's parameter list
+_PARAM_RE = re.compile(r'(\w+)\s+([\*\w\.]+)')
+
+_METHOD_ANCHOR = 'func (c *Client) '
 
-# Step 2: Parse api-2-2-2-consolidated.json for operations
-print("\n[2/4] Parsing api-2-2-2-consolidated.json...")
-with open('api-2-2-2-consolidated.json', 'r') as f:
-    spec = json.load(f)
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'patch', 'delete'})
+_CONTROLLER_SUFFIX = 'Controller'
+
+
+def _scan_client_methods(content):
+    """Yield (name, params_str, returns_str) per client method.
+
+    Linear scan anchored on the literal method prefix with a balanced-paren
+    depth counter — one O(N) pass over the file instead of a backtracking
+    regex re-examining overlapping contexts.
+    """
+    find = content.find
+    anchor_len = len(_METHOD_ANCHOR)
+    pos = 0
+    while True:
+        idx = find(_METHOD_ANCHOR, pos)
+        if idx < 0:
+            return
+        name_start = idx + anchor_len
+        name_end = find('(', name_start)
+        if name_end < 0:
+            return
+        name = content[name_start:name_end]
+        depth = 1
+        i = name_end + 1
+        n = len(content)
+        while i < n and depth:
+            ch = content[i]
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+            i += 1
+        params = content[name_end + 1:i - 1]
+        pos = i
+        if not params.startswith('ctx context.Context'):
+            continue
+        j = i
+        while j < n and content[j] == ' ':
+            j += 1
+        if j >= n or content[j] != '(':
+            continue
+        k = find(')', j)
+        if k < 0:
+            return
+        pos = k
+        yield name, params, content[j + 1:k]
+
+print("=" * 70)
+print("CLIENT_EXT.GO GENERATOR")
+print("=" * 70)
 
+# Step 1: Parse api-2-2-2-consolidated.json for operations
+print("\n[1/4] Parsing api-2-2-2-consolidated.json...")
 operations_by_controller = {}
 
-for path, path_item in spec.get('paths', {}).items():
+for path, path_item in _iter_paths('api-2-2-2-consolidated.json'):
     for http_method, op_spec in path_item.items():
-        if http_method not in ['get', 'post', 'put', 'patch', 'delete']:
+        if http_method not in _HTTP_METHODS:
             continue
         
         op_id = op_spec.get('operationId')
@@ -70,7 +108,10 @@ for path, path_item in spec.get('paths', {}).items():
         method_snake = parts[1]      # e.g., "create"
         
         # Controller name without "Controller" suffix
-        controller = controller_full.replace('Controller', '')
+        if controller_full.endswith(_CONTROLLER_SUFFIX):
+            controller = controller_full[:-len(_CONTROLLER_SUFFIX)]
+        else:
+            controller = controller_full
         
         # Convert method to PascalCase: findAll -> FindAll, get_status -> GetStatus
         # Just capitalize first letter of each word, preserve rest
@@ -99,6 +140,46 @@ for path, path_item in spec.get('paths', {}).items():
 total_ops = sum(len(ops) for ops in operations_by_controller.values())
 print(f"   ✓ Found {total_ops} operations in {len(operations_by_controller)} controllers")
 
+# Only these Go methods can ever be emitted; anything else in the
+# generated client is parsed for nothing.
+needed_methods = {
+    op['goMethod']
+    for ops in operations_by_controller.values()
+    for op in ops
+}
+
+# Step 2: Parse oas_client_gen.go for method signatures
+print("\n[2/4] Parsing oas_client_gen.go...")
+# Binary read + one decode: skips text-mode newline translation and
+# incremental decoding across the multi-MB generated client
+with open('api/oas_client_gen.go', 'rb', buffering=65536) as f:
+    content = f.read().decode('utf-8')
+
+# Extract method signatures more carefully
+methods = {}
+# Scan: func (c *Client) MethodName(ctx context.Context, ...) (...) {
+for method_name, full_params, returns in _scan_client_methods(content):
+    if method_name not in needed_methods:  # covers internal/send* helpers too
+        continue
+    
+    # Parse params (skip ctx)
+    params_list = []
+    if ', ' in full_params:
+        params_str = full_params.split(', ', 1)[1]  # Remove "ctx context.Context"
+        # Split remaining params carefully
+        for param in _PARAM_RE.findall(params_str):
+            params_list.append((param[0], param[1]))
+    
+    # Parse returns
+    returns_list = [r.strip() for r in returns.split(',')]
+    
+    methods[method_name] = {
+        'params': params_list,
+        'returns': returns_list
+    }
+
+print(f"   ✓ Found {len(methods)} client methods")
+
 # Step 3: Generate code
 print("\n[3/4] Generating code...")
 
@@ -106,79 +187,58 @@ def to_camel(s):
     """PascalCase -> camelCase"""
     return s[0].lower() + s[1:] if s else s
 
-code = '''// Code generated by generate_clientext_final.py. DO NOT EDIT manually.
-// Generated from api-2-2-2-consolidated.json with renamed schemas.
-
-package api
-
-import "context"
-
-// ClientExt wraps the base Client with organized sub-client access.
-type ClientExt struct {
-\t*Client
-'''
-
-# Add fields for each controller
-for controller in sorted(operations_by_controller.keys()):
-    field_name = to_camel(controller)
-    code += f'\t{field_name} *{controller}Client\n'
 
-code += '''}
+# Go source templates, defined once at module level so emission is a
+# single .format call per site instead of f-string assembly inline.
+_ACCESSOR_TMPL = '''// {c} returns the {c}Client.
+func (ce *ClientExt) {c}() *{c}Client {{
+\treturn ce.{f}
+}}
 
-// NewClientExt creates a new ClientExt wrapper.
-func NewClientExt(client *Client) *ClientExt {
-\treturn &ClientExt{
-\t\tClient: client,
 '''
 
-# Initialize fields
-for controller in sorted(operations_by_controller.keys()):
-    field_name = to_camel(controller)
-    code += f'\t\t{field_name}: New{controller}Client(client),\n'
+_SUBCLIENT_TMPL = '''// {c}Client provides {c} operations.
+type {c}Client struct {{
+\tclient *Client
+}}
 
-code += '''\t}
-}
+// New{c}Client creates a new {c}Client.
+func New{c}Client(client *Client) *{c}Client {{
+\treturn &{c}Client{{client: client}}
+}}
 
 '''
 
-# Accessor methods
-for controller in sorted(operations_by_controller.keys()):
-    field_name = to_camel(controller)
-    code += f'''// {controller} returns the {controller}Client.
-func (ce *ClientExt) {controller}() *{controller}Client {{
-\treturn ce.{field_name}
+_METHOD_TMPL = '''// {display} calls {op_id}.
+func (sc *{c}Client) {display}(ctx context.Context{sig}){ret} {{
+\t{stmt}sc.client.{go}(ctx{call})
 }}
 
 '''
 
-# Sub-client types and methods
-for controller in sorted(operations_by_controller.keys()):
-    code += f'''// {controller}Client provides {controller} operations.
-type {controller}Client struct {{
-\tclient *Client
-}}
 
-// New{controller}Client creates a new {controller}Client.
-func New{controller}Client(client *Client) *{controller}Client {{
-\treturn &{controller}Client{{client: client}}
-}}
+def _emit_controller(controller, ops, methods):
+    """Emit one controller's sub-client type and methods.
 
-'''
-    
-    # Generate methods for this controller
-    for op in sorted(operations_by_controller[controller], key=lambda x: x['goMethod']):
+    Pure function of its inputs so controllers can be emitted in any
+    order (or fanned out) and joined in sorted order; returns the code
+    chunk plus the Go method names that had no match in the client.
+    """
+    chunk = [_SUBCLIENT_TMPL.format(c=controller)]
+    missing = []
+    for op in sorted(ops, key=lambda x: x['goMethod']):
         go_method = op['goMethod']
         display_method = op['displayMethod']
         op_id = op['operationId']
-        
-        if go_method not in methods:
-            print(f"   ⚠ Warning: {go_method} not found in oas_client_gen.go")
+
+        method_info = methods.get(go_method)
+        if method_info is None:
+            missing.append(go_method)
             continue
-        
-        method_info = methods[go_method]
+
         params = method_info['params']
         returns = method_info['returns']
-        
+
         # Build parameter list
         if params:
             params_sig = ', '.join([f'{p[0]} {p[1]}' for p in params])
@@ -186,7 +246,7 @@ func New{controller}Client(client *Client) *{controller}Client {{
         else:
             params_sig = ''
             params_call = ''
-        
+
         # Build return type
         if returns:
             ret_type = ', '.join(returns)
@@ -194,35 +254,71 @@ func New{controller}Client(client *Client) *{controller}Client {{
                 ret_type = f'({ret_type})'
         else:
             ret_type = ''
-        
-        # Generate method
-        code += f'''// {display_method} calls {op_id}.
-func (sc *{controller}Client) {display_method}(ctx context.Context'''
-        
-        if params_sig:
-            code += f', {params_sig}'
-        
-        code += ')'
-        
-        if ret_type:
-            code += f' {ret_type}'
-        
-        code += ' {\n'
-        
-        if returns:
-            code += f'\treturn sc.client.{go_method}(ctx'
-        else:
-            code += f'\tsc.client.{go_method}(ctx'
-        
-        if params_call:
-            code += f', {params_call}'
-        
-        code += ')\n}\n\n'
+
+        chunk.append(_METHOD_TMPL.format(
+            display=display_method,
+            op_id=op_id,
+            c=controller,
+            go=go_method,
+            sig=f', {params_sig}' if params_sig else '',
+            ret=f' {ret_type}' if ret_type else '',
+            stmt='return ' if returns else '',
+            call=f', {params_call}' if params_call else '',
+        ))
+    return ''.join(chunk), missing
+
+controllers_sorted = sorted(operations_by_controller)
+camel = {c: to_camel(c) for c in controllers_sorted}
+
+parts = ['''// Code generated by generate_clientext_final.py. DO NOT EDIT manually.
+// Generated from api-2-2-2-consolidated.json with renamed schemas.
+
+package api
+
+import "context"
+
+// ClientExt wraps the base Client with organized sub-client access.
+type ClientExt struct {
+\t*Client
+''']
+
+# Add fields for each controller
+for controller in controllers_sorted:
+    parts.append(f'\t{camel[controller]} *{controller}Client\n')
+
+parts.append('''}
+
+// NewClientExt creates a new ClientExt wrapper.
+func NewClientExt(client *Client) *ClientExt {
+\treturn &ClientExt{
+\t\tClient: client,
+''')
+
+# Initialize fields
+for controller in controllers_sorted:
+    parts.append(f'\t\t{camel[controller]}: New{controller}Client(client),\n')
+
+parts.append('''\t}
+}
+
+''')
+
+# Accessor methods
+for controller in controllers_sorted:
+    parts.append(_ACCESSOR_TMPL.format(c=controller, f=camel[controller]))
+
+# Sub-client types and methods
+for controller in controllers_sorted:
+    chunk, missing = _emit_controller(controller, operations_by_controller[controller], methods)
+    for go_method in missing:
+        print(f"   ⚠ Warning: {go_method} not found in oas_client_gen.go")
+    parts.append(chunk)
 
 # Step 4: Write to file
 print("\n[4/4] Writing api/client_ext.go...")
-with open('api/client_ext.go', 'w') as f:
-    f.write(code)
+code = ''.join(parts)
+with open('api/client_ext.go', 'wb', buffering=65536) as f:
+    f.write(code.encode('utf-8'))
 
 print("\n" + "=" * 70)
 print(f"✅ SUCCESS!")
@@ -13,15 +13,32 @@ Usage:
     python3 scripts/pipeline.py specs/api-2-3-0.json
 """
 
+import hashlib
 import json
+import os
+import pickle
 import subprocess
+import functools
 import sys
 import re
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 from smart_consolidate import SmartConsolidator, InlineSchemaExtractor, unify_error_responses, fix_nullable_without_type
 
+try:
+    import ijson  # optional: lets parse_operations stream just the paths section
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: 3-10x faster spec parse/serialize than stdlib json
+except ImportError:
+    orjson = None
+
 
 class Colors:
     HEADER = '\033[95m'
@@ -61,14 +78,22 @@ def print_info(message: str):
 # STEP 1: SMART CONSOLIDATE SCHEMAS
 # ============================================================================
 
-def smart_consolidate_schemas(input_file: str, output_file: str, skip_inline_extraction: bool = False) -> Tuple[int, int, dict]:
+def smart_consolidate_schemas(input_file: str, output_file: str = None, skip_inline_extraction: bool = False) -> Tuple[int, int, dict, dict]:
     """
     Consolidate duplicate schemas using smart analysis.
     Combines old Steps 1 (consolidate) and 2 (rename) into one step.
+
+    Returns the consolidated spec so callers can keep post-processing it
+    in memory. The spec is only serialized when output_file is given;
+    the pipeline itself defers writing until all post-processing is done,
+    saving a full dump/parse round-trip of the multi-MB spec.
     """
     print_info(f"Loading {input_file}...")
-    with open(input_file, 'r') as f:
-        spec = json.load(f)
+    # 64KB buffer: fewer read syscalls than the default on multi-MB specs
+    with open(input_file, 'rb', buffering=65536) as f:
+        raw = f.read()
+    spec = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    del raw
     
     original_count = len(spec.get('components', {}).get('schemas', {}))
     
@@ -91,7 +116,7 @@ def smart_consolidate_schemas(input_file: str, output_file: str, skip_inline_ext
     
     if not rename_map:
         print_warning("No duplicates to consolidate")
-        return original_count, original_count, {}
+        return original_count, original_count, {}, spec
     
     # Apply consolidation
     new_spec = consolidator.apply_consolidation(rename_map)
@@ -122,10 +147,15 @@ def smart_consolidate_schemas(input_file: str, output_file: str, skip_inline_ext
     else:
         print_info("Skipping inline schema extraction")
     
-    print_info(f"Writing {output_file}...")
-    with open(output_file, 'w') as f:
-        json.dump(new_spec, f, indent=2, ensure_ascii=False)
-    
+    if output_file:
+        print_info(f"Writing {output_file}...")
+        if orjson is not None:
+            with open(output_file, 'wb', buffering=65536) as f:
+                f.write(orjson.dumps(new_spec, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(new_spec, f, indent=2, ensure_ascii=False)
+
     # Print top consolidated groups
     print_info("Top consolidated groups:")
     for name, schemas in sorted(stats['consolidated_names'].items(), key=lambda x: -len(x[1]))[:5]:
@@ -135,7 +165,7 @@ def smart_consolidate_schemas(input_file: str, output_file: str, skip_inline_ext
     stats['final_count'] = new_count
     print_success(f"Consolidated {original_count} → {new_count} schemas (-{original_count - new_count}, -{(original_count-new_count)*100//original_count}%)")
     
-    return original_count, new_count, stats
+    return original_count, new_count, stats, new_spec
 
 
 # ============================================================================
@@ -144,11 +174,11 @@ def smart_consolidate_schemas(input_file: str, output_file: str, skip_inline_ext
 
 # These subscription endpoints return text/plain (subscription configs as strings),
 # but the OpenAPI spec doesn't declare response content, causing ogen to skip them.
-SUBSCRIPTION_TEXT_OPERATIONS = [
+SUBSCRIPTION_TEXT_OPERATIONS = frozenset({
     'SubscriptionController_getSubscription',
     'SubscriptionController_getSubscriptionByClientType',
     'SubscriptionController_getSubscriptionWithType',
-]
+})
 
 
 def patch_subscription_text_responses(spec: dict) -> int:
@@ -230,28 +260,34 @@ def strip_dto_suffix(spec: dict) -> int:
     if not rename_map:
         return 0
 
-    # Rename schemas
-    new_schemas = {}
-    for name, schema in schemas.items():
-        new_name = rename_map.get(name, name)
-        new_schemas[new_name] = schema
-    spec['components']['schemas'] = new_schemas
+    # Rename in place: O(|rename_map|) pops instead of copying the whole
+    # schemas table. The collision check above guarantees each new key is
+    # free, and the ref walk below visits the renamed bodies either way,
+    # so the spec is set up and traversed once.
+    for name, new_name in rename_map.items():
+        schemas[new_name] = schemas.pop(name)
 
     # Update all $ref pointers throughout the spec
     old_prefix = '#/components/schemas/'
     ref_map = {f'{old_prefix}{old}': f'{old_prefix}{new}' for old, new in rename_map.items()}
 
-    def _update_refs(obj):
+    # Iterative worklist: no Python call frame per node, and scalar values
+    # are never pushed at all. A $ref object is opaque per OpenAPI, so its
+    # siblings can't contain further refs and that whole branch is skipped.
+    get = ref_map.get
+    stack = deque([spec])
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, dict):
-            if '$ref' in obj and obj['$ref'] in ref_map:
-                obj['$ref'] = ref_map[obj['$ref']]
-            for v in obj.values():
-                _update_refs(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                _update_refs(item)
-
-    _update_refs(spec)
+            ref = obj.get('$ref')
+            if ref is not None:
+                new_ref = get(ref)
+                if new_ref is not None:
+                    obj['$ref'] = new_ref
+                continue
+            stack.extend(v for v in obj.values() if isinstance(v, (dict, list)))
+        else:
+            stack.extend(item for item in obj if isinstance(item, (dict, list)))
     return len(rename_map)
 
 
@@ -289,32 +325,77 @@ def fix_number_query_params(spec: dict) -> int:
 # STEP 2: GENERATE GO CLIENT WITH OGEN
 # ============================================================================
 
+OGEN_VERSION = 'v1.19.0'
+
+
+def _ogen_command() -> list:
+    """Return the argv prefix for the pinned ogen generator.
+
+    go run re-resolves module metadata and relinks ogen on every pipeline
+    run. Installing the pinned version once into the cache dir and invoking
+    the binary directly removes that latency from every subsequent run.
+    Falls back to go run if the install fails.
+    """
+    binary = _CACHE_DIR / f'ogen-{OGEN_VERSION}'
+    if binary.exists():
+        return [str(binary)]
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(
+            ['go', 'install', f'github.com/ogen-go/ogen/cmd/ogen@{OGEN_VERSION}'],
+            env={**os.environ, 'GOBIN': str(_CACHE_DIR)},
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        installed = _CACHE_DIR / 'ogen'
+        if result.returncode == 0 and installed.exists():
+            installed.rename(binary)
+            print_info(f"Installed ogen {OGEN_VERSION} to {binary}")
+            return [str(binary)]
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    return ['go', 'run', f'github.com/ogen-go/ogen/cmd/ogen@{OGEN_VERSION}']
+
+
 def generate_ogen_client(spec_file: str) -> bool:
     """Generate Go client using ogen"""
     print_info(f"Running ogen with {spec_file}...")
-    
+
+    proc = None
     try:
-        result = subprocess.run(
-            [
-                'go', 'run', 'github.com/ogen-go/ogen/cmd/ogen@v1.19.0',
+        # Stream stderr line by line instead of buffering the whole output:
+        # ogen can emit a lot of progress text on big specs, and capture_output
+        # would hold all of it in memory until exit. Only a tail ring buffer
+        # is kept for error reporting.
+        proc = subprocess.Popen(
+            _ogen_command() + [
                 '--config', '.ogen.yml',
                 '--target', 'api',
                 '--package', 'api',
                 '--clean',
                 spec_file
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=120
+            bufsize=1,
+            # -trimpath keeps go-run fallback builds cache-friendly across
+            # checkouts; a no-op when the installed binary runs directly
+            env={**os.environ, 'GOFLAGS': '-trimpath'}
         )
+        stderr_tail = deque(maxlen=200)
+        for line in proc.stderr:
+            stderr_tail.append(line)
         
-        if result.returncode == 0:
+        if proc.wait(timeout=120) == 0:
             print_success(f"Go client generated from {spec_file}")
             return True
         else:
-            print_error(f"ogen generation failed: {result.stderr}")
+            print_error(f"ogen generation failed: {''.join(stderr_tail)}")
             return False
     except subprocess.TimeoutExpired:
+        proc.kill()
         print_error("ogen generation timed out")
         return False
     except Exception as e:
@@ -326,22 +407,151 @@ def generate_ogen_client(spec_file: str) -> bool:
 # STEP 3: GENERATE CLIENT_EXT.GO
 # ============================================================================
 
-def parse_oas_client_methods(client_file: str) -> dict:
-    """Parse method signatures from oas_client_gen.go"""
-    with open(client_file, 'r') as f:
-        content = f.read()
+# Parsed-result cache for the generate step. Keyed on the input file's
+# content hash, so re-running the pipeline on unchanged inputs skips the
+# file scan entirely. Bump the version when a parser's output shape changes.
+_CACHE_DIR = Path.home() / '.cache' / 'remnawave_pipeline'
+_CACHE_VERSION = 1
 
-    methods = {}
-    pattern = r'func \(c \*Client\) (\w+)\((ctx context\.Context(?:,\s*[^)]+)?)\)\s*\(([^)]+)\)'
 
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        method_name = match.group(1)
-        if method_name in ['requestURL'] or method_name.startswith('send'):
+def _cached_parse(hash_file: bool = True):
+    """Memoize a single-argument parser on disk, keyed by content hash.
+
+    With hash_file the argument is a path whose bytes are hashed; otherwise
+    the argument is the content itself (str or bytes).
+    """
+    def decorate(fn):
+        def wrapper(arg):
+            cache_file = None
+            try:
+                if hash_file:
+                    with open(arg, 'rb', buffering=65536) as f:
+                        data = f.read()
+                else:
+                    data = arg.encode() if isinstance(arg, str) else arg
+                digest = hashlib.sha256(data).hexdigest()
+                cache_file = _CACHE_DIR / f'{fn.__name__}-v{_CACHE_VERSION}-{digest}.pkl'
+            except OSError:
+                cache_file = None
+
+            if cache_file is not None and cache_file.exists():
+                try:
+                    return pickle.loads(cache_file.read_bytes())
+                except Exception:
+                    # Cache reads are best-effort: a truncated or corrupt
+                    # entry (e.g. an interrupted run) must never take the
+                    # pipeline down. Fall through and overwrite it below.
+                    pass
+
+            result = fn(arg)
+
+            if cache_file is not None:
+                try:
+                    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    # Write via temp file + rename so a crash mid-write
+                    # can't leave a truncated entry behind
+                    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+                    tmp_file.write_bytes(pickle.dumps(result))
+                    os.replace(tmp_file, cache_file)
+                except OSError:
+                    pass
+            return result
+
+        wrapper.__name__ = fn.__name__
+        wrapper.__doc__ = fn.__doc__
+        return wrapper
+
+    return decorate
+
+
+# Compiled once at import: these run once per generated method, and explicit
+# compilation skips the re-cache lookup on every call.
+_OPTIONS_RE = re.compile(r',?\s*options\s+\.\.\.RequestOption')
+# Params-struct pattern, compiled once at import
+_STRUCT_RE = re.compile(r'type (\w+Params) struct \{([^}]*)\}', re.DOTALL)
+
+_METHOD_ANCHOR = b'func (c *Client) '
+_OPEN_PAREN = ord('(')
+_CLOSE_PAREN = ord(')')
+
+
+def _scan_paren_group(content: bytes, idx: int) -> tuple:
+    """Scan a balanced parenthesized group starting at content[idx] == '('.
+
+    Returns (inner_bytes, index_past_closing_paren), or (None, idx) if the
+    group never closes.
+    """
+    depth = 0
+    start = idx + 1
+    n = len(content)
+    while idx < n:
+        ch = content[idx]
+        if ch == _OPEN_PAREN:
+            depth += 1
+        elif ch == _CLOSE_PAREN:
+            depth -= 1
+            if depth == 0:
+                return content[start:idx], idx + 1
+        idx += 1
+    return None, idx
+
+
+def _iter_client_methods(content: bytes):
+    """Yield (method_name, params_text, returns_text) for each Client method.
+
+    A single linear pass anchored on the literal method prefix with balanced
+    paren counting — no regex backtracking over the whole file. The scan
+    stays on raw bytes so the generated file is never decoded wholesale;
+    only the small captured groups are (they are pure ASCII Go identifiers
+    and type lists).
+    """
+    n = len(content)
+    idx = 0
+    while True:
+        idx = content.find(_METHOD_ANCHOR, idx)
+        if idx == -1:
+            return
+        name_start = idx + len(_METHOD_ANCHOR)
+        idx = name_start
+        paren = content.find(b'(', name_start)
+        if paren == -1:
+            return
+        name = content[name_start:paren]
+        # Reject the transport plumbing up front, before any paren scanning
+        # or decoding: requestURL and the send* twins of every operation.
+        if name == b'requestURL' or name.startswith(b'send'):
+            continue
+        method_name = name.decode('ascii', 'replace')
+        if not method_name.isidentifier():
+            continue
+
+        params, after = _scan_paren_group(content, paren)
+        if params is None or not params.startswith(b'ctx context.Context'):
             continue
 
-        full_params = match.group(2)
-        returns = match.group(3)
+        # Returns must be a parenthesized group right after the params
+        rest = after
+        while rest < n and content[rest] in b' \t':
+            rest += 1
+        if rest >= n or content[rest] != _OPEN_PAREN:
+            continue
+        returns, after = _scan_paren_group(content, rest)
+        if returns is None:
+            continue
+
+        yield method_name, params.decode('ascii'), returns.decode('ascii')
+        idx = after
+
+
+@_cached_parse(hash_file=False)
+def parse_oas_client_methods(content) -> dict:
+    """Parse method signatures from oas_client_gen.go source bytes"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    methods = {}
 
+    for method_name, full_params, returns in _iter_client_methods(content):
         # Parse params (skip ctx and variadic options)
         params_list = []
         has_options = False
@@ -351,9 +561,13 @@ def parse_oas_client_methods(client_file: str) -> dict:
             if '...RequestOption' in params_str:
                 has_options = True
                 # Remove variadic param before parsing regular params
-                params_str = re.sub(r',?\s*options\s+\.\.\.RequestOption', '', params_str).strip()
-            for param in re.findall(r'(\w+)\s+([\*\w\.]+)', params_str):
-                params_list.append((param[0], param[1]))
+                params_str = _OPTIONS_RE.sub('', params_str).strip()
+            # Flat 'name type' pairs separated by ', ' — a split beats
+            # regex engine setup for these short strings
+            for p in params_str.split(', '):
+                name, _, typ = p.strip().partition(' ')
+                if name and typ:
+                    params_list.append((name, typ))
 
         returns_list = [r.strip() for r in returns.split(',')]
 
@@ -366,33 +580,35 @@ def parse_oas_client_methods(client_file: str) -> dict:
     return methods
 
 
+@_cached_parse()
 def parse_params_structs(params_file: str) -> dict:
     """Parse Params struct fields from oas_parameters_gen.go"""
-    with open(params_file, 'r') as f:
-        content = f.read()
+    with open(params_file, 'rb', buffering=65536) as f:
+        content = f.read().decode('utf-8')
     
     params_structs = {}
     
     # Match struct definitions with their fields
     # Pattern: type XXXParams struct {\n\tField Type\n}
-    pattern = r'type (\w+Params) struct \{([^}]*)\}'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
+    for match in _STRUCT_RE.finditer(content):
         struct_name = match.group(1)
         fields_block = match.group(2)
         
         fields = []
-        # Parse fields: Name Type or Name Type `json:"..."`
+        # Parse fields: Name Type or Name Type `json:"..."` — simple enough
+        # grammar that whitespace splitting beats a per-line regex match
         for line in fields_block.strip().split('\n'):
             line = line.strip()
             if not line or line.startswith('//'):
                 continue
-            # Match field: UUID string or Size OptFloat64
-            field_match = re.match(r'^(\w+)\s+([\w\.\*\[\]]+)', line)
-            if field_match:
-                field_name = field_match.group(1)
-                field_type = field_match.group(2)
-                fields.append((field_name, field_type))
+            toks = line.split(None, 2)
+            if len(toks) < 2:
+                continue
+            field_name = toks[0]
+            first = field_name[:1]
+            if not (first.isalpha() or first == '_'):
+                continue
+            fields.append((field_name, toks[1]))
         
         params_structs[struct_name] = fields
     
@@ -411,6 +627,16 @@ def simplify_param_type(param_type: str) -> str:
     return type_map.get(param_type, param_type)
 
 
+# Optional-type constructors for the simplified signature emission; a dict
+# lookup replaces a Unicode .title() pass per Opt field in the hot loop
+_OPT_CTOR = {
+    'string': 'NewOptString',
+    'int': 'NewOptInt',
+    'float64': 'NewOptFloat64',
+    'bool': 'NewOptBool',
+}
+
+
 # Go reserved keywords that cannot be used as identifiers
 GO_KEYWORDS = {
     'break', 'case', 'chan', 'const', 'continue', 'default', 'defer', 'else',
@@ -428,6 +654,7 @@ def safe_param_name(name: str) -> str:
     return lower
 
 
+@functools.lru_cache(maxsize=None)
 def _to_pascal(s: str) -> str:
     """Convert first letter to uppercase, preserving camelCase."""
     if not s:
@@ -435,36 +662,88 @@ def _to_pascal(s: str) -> str:
     return s[0].upper() + s[1:]
 
 
-def parse_operations(spec_file: str) -> dict:
-    """Parse operations from OpenAPI spec"""
-    with open(spec_file, 'r') as f:
-        spec = json.load(f)
+@functools.lru_cache(maxsize=None)
+def _to_camel(s: str) -> str:
+    """Convert first letter to lowercase, preserving camelCase."""
+    return s[0].lower() + s[1:] if s else s
 
-    operations_by_controller = {}
 
-    for path, path_item in spec.get('paths', {}).items():
+@functools.lru_cache(maxsize=None)
+def _snake_to_pascal(method_snake: str) -> str:
+    """Convert snake_case to PascalCase. Cached: method names like 'create'
+    or 'get_all' repeat across controllers."""
+    return ''.join(_to_pascal(p) for p in method_snake.split('_'))
+
+
+def _iter_spec_paths(spec_file: str):
+    """Yield (path, path_item) pairs from the spec's paths section.
+
+    Only operationIds are needed here, so with ijson installed we stream the
+    paths section and never materialize components.schemas (the bulk of the
+    document). Without ijson this falls back to a full json.load.
+    """
+    if ijson is not None:
+        with open(spec_file, 'rb', buffering=65536) as f:
+            yield from ijson.kvitems(f, 'paths')
+        return
+
+    with open(spec_file, 'rb', buffering=65536) as f:
+        raw = f.read()
+    spec = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    yield from spec.get('paths', {}).items()
+
+
+def parse_operations(spec: dict) -> dict:
+    """Parse operations from an already-parsed OpenAPI spec"""
+    return _collect_operations(spec.get('paths', {}).items())
+
+
+@_cached_parse()
+def parse_operations_file(spec_file: str) -> dict:
+    """Parse operations from a spec file (streams paths when ijson is available)"""
+    return _collect_operations(_iter_spec_paths(spec_file))
+
+
+_HTTP_METHODS = frozenset(('get', 'post', 'put', 'patch', 'delete'))
+
+# C-implemented sort key: avoids a Python-level dict lookup per comparison
+_GO_METHOD = itemgetter('goMethod')
+
+
+def _collect_operations(path_items) -> dict:
+    """Group operations by controller from (path, path_item) pairs"""
+    operations_by_controller = defaultdict(list)
+    # controller_full -> interned short name; the replace() only runs once
+    # per distinct controller instead of once per operation
+    controller_names = {}
+
+    for path, path_item in path_items:
         for http_method, op_spec in path_item.items():
-            if http_method not in ['get', 'post', 'put', 'patch', 'delete']:
+            if http_method not in _HTTP_METHODS:
                 continue
 
             op_id = op_spec.get('operationId')
-            if not op_id or '_' not in op_id:
+            if not op_id:
+                continue
+            sep = op_id.find('_')
+            if sep == -1:
                 continue
 
-            parts = op_id.split('_', 1)
-            controller_full = parts[0]
-            method_snake = parts[1]
+            controller_full = op_id[:sep]
+            method_snake = op_id[sep + 1:]
 
-            controller = controller_full.replace('Controller', '')
+            # Few distinct controllers across hundreds of ops: interning
+            # makes the grouping key one shared object, so the defaultdict
+            # probes hit the identity fast path instead of re-hashing
+            controller = controller_names.get(controller_full)
+            if controller is None:
+                controller = sys.intern(controller_full.replace('Controller', ''))
+                controller_names[controller_full] = controller
 
-            method_parts = method_snake.split('_')
-            method_pascal = ''.join(_to_pascal(p) for p in method_parts)
+            method_pascal = _snake_to_pascal(method_snake)
 
             go_method = controller_full + method_pascal
 
-            if controller not in operations_by_controller:
-                operations_by_controller[controller] = []
-
             operations_by_controller[controller].append({
                 'operationId': op_id,
                 'goMethod': go_method,
@@ -474,56 +753,12 @@ def parse_operations(spec_file: str) -> dict:
     return operations_by_controller
 
 
-def generate_client_ext(spec_file: str, client_file: str, output_file: str) -> Tuple[int, int]:
-    """Generate client_ext.go wrapper with simplified method signatures"""
-    print_info("Parsing oas_client_gen.go...")
-    methods = parse_oas_client_methods(client_file)
-    print_success(f"Found {len(methods)} client methods")
-    
-    # Parse params structs for simplification
-    params_file = client_file.replace('oas_client_gen.go', 'oas_parameters_gen.go')
-    print_info("Parsing oas_parameters_gen.go...")
-    params_structs = parse_params_structs(params_file)
-    print_success(f"Found {len(params_structs)} param structs")
-    
-    print_info("Parsing operations from spec...")
-    operations_by_controller = parse_operations(spec_file)
-    total_ops = sum(len(ops) for ops in operations_by_controller.values())
-    print_success(f"Found {total_ops} operations in {len(operations_by_controller)} controllers")
-    
-    def to_camel(s):
-        return s[0].lower() + s[1:] if s else s
-    
-    def can_simplify_params(params_type: str) -> tuple:
-        """
-        Check if Params struct can be simplified to individual arguments.
-        Returns (can_simplify, [(field_name, field_type, simple_type), ...])
-        """
-        struct_name = params_type.lstrip('*')
-        if struct_name not in params_structs:
-            return False, []
-        
-        fields = params_structs[struct_name]
-        if not fields:
-            return False, []
-        
-        # Only simplify if all fields are simple types
-        simple_types = {'string', 'int', 'int64', 'float64', 'bool', 
-                       'OptString', 'OptInt', 'OptInt64', 'OptFloat64', 'OptBool'}
-        
-        simplified = []
-        for field_name, field_type in fields:
-            if field_type in simple_types or field_type.startswith('Opt'):
-                simple = simplify_param_type(field_type)
-                simplified.append((field_name, field_type, simple))
-            else:
-                # Complex type, don't simplify
-                return False, []
-        
-        return True, simplified
-    
-    # Generate code
-    code = '''// Code generated by pipeline.py. DO NOT EDIT manually.
+# Static sections of the generated client_ext.go. Defined once at module
+# scope so every generate_client_ext call reuses the same objects — the
+# compile-once half of a template engine without taking on the dependency.
+# Dynamic sections stay as f-strings, which CPython compiles into the
+# function's bytecode anyway.
+_EXT_HEADER = '''// Code generated by pipeline.py. DO NOT EDIT manually.
 
 package api
 
@@ -534,24 +769,16 @@ import "context"
 type ClientExt struct {
 \tclient *Client
 '''
-    
-    for controller in sorted(operations_by_controller.keys()):
-        field_name = to_camel(controller)
-        code += f'\t{field_name} *{controller}Client\n'
-    
-    code += '''}
+
+_EXT_CONSTRUCTOR = '''}
 
 // NewClientExt creates a new ClientExt wrapper.
 func NewClientExt(client *Client) *ClientExt {
 \treturn &ClientExt{
 \t\tclient: client,
 '''
-    
-    for controller in sorted(operations_by_controller.keys()):
-        field_name = to_camel(controller)
-        code += f'\t\t{field_name}: New{controller}Client(client),\n'
-    
-    code += '''\t}
+
+_EXT_BASE_ACCESSOR = '''\t}
 }
 
 // Client returns the underlying ogen Client.
@@ -560,138 +787,239 @@ func (ce *ClientExt) Client() *Client {
 }
 
 '''
-    
-    for controller in sorted(operations_by_controller.keys()):
-        field_name = to_camel(controller)
-        code += f'''// {controller} returns the {controller}Client.
-func (ce *ClientExt) {controller}() *{controller}Client {{
-\treturn ce.{field_name}
+
+# Per-controller boilerplate, formatted once per controller instead of
+# re-built from separate f-strings each loop iteration
+_ACCESSOR_TMPL = '''// {c} returns the {c}Client.
+func (ce *ClientExt) {c}() *{c}Client {{
+\treturn ce.{f}
 }}
 
 '''
-    
-    matched_methods = 0
-    
-    for controller in sorted(operations_by_controller.keys()):
-        code += f'''// {controller}Client provides {controller} operations.
-type {controller}Client struct {{
+
+_CONTROLLER_TMPL = '''// {c}Client provides {c} operations.
+type {c}Client struct {{
 \tclient *Client
 }}
 
-// New{controller}Client creates a new {controller}Client.
-func New{controller}Client(client *Client) *{controller}Client {{
-\treturn &{controller}Client{{client: client}}
+// New{c}Client creates a new {c}Client.
+func New{c}Client(client *Client) *{c}Client {{
+\treturn &{c}Client{{client: client}}
 }}
 
 '''
-        
-        for op in sorted(operations_by_controller[controller], key=lambda x: x['goMethod']):
-            go_method = op['goMethod']
-            display_method = op['displayMethod']
-            op_id = op['operationId']
-            
-            if go_method not in methods:
-                continue
-            
-            matched_methods += 1
-            method_info = methods[go_method]
-            params = method_info['params']
-            returns = method_info['returns']
-            has_options = method_info.get('has_options', False)
-
-            # options suffix for signature and call
-            opts_sig = ', options ...RequestOption' if has_options else ''
-            opts_call = ', options...' if has_options else ''
-
-            # Check if we can simplify Params struct to individual args
-            simplified_params = None
-            params_index = None
-            for i, (pname, ptype) in enumerate(params):
-                if ptype.endswith('Params'):
-                    can_simplify, simplified = can_simplify_params(ptype)
-                    if can_simplify:
-                        simplified_params = simplified
-                        params_index = i
-                    break
-
-            if returns:
-                ret_type = ', '.join(returns)
-                if len(returns) > 1:
-                    ret_type = f'({ret_type})'
-            else:
-                ret_type = ''
 
-            # Generate method with simplified params or original
-            if simplified_params and params_index is not None:
-                params_type = params[params_index][1]
 
-                sig_parts = []
-                for i, (pname, ptype) in enumerate(params):
-                    if i == params_index:
-                        for field_name, field_type, simple_type in simplified_params:
-                            sig_parts.append(f'{safe_param_name(field_name)} {simple_type}')
-                    else:
-                        sig_parts.append(f'{pname} {ptype}')
+def generate_client_ext(spec_file: str, client_file: str, output_file: str, spec: dict = None) -> Tuple[int, int]:
+    """Generate client_ext.go wrapper with simplified method signatures.
 
-                simple_args = ', '.join(sig_parts)
-
-                params_init = f'{params_type}{{\n'
-                for field_name, field_type, simple_type in simplified_params:
-                    arg_name = safe_param_name(field_name)
-                    if field_type.startswith('Opt'):
-                        params_init += f'\t\t{field_name}: NewOpt{simple_type.title()}({arg_name}),\n'
-                    else:
-                        params_init += f'\t\t{field_name}: {arg_name},\n'
-                params_init += '\t}'
+    When the caller already holds the parsed spec (the pipeline does, after
+    post-processing it in memory), passing it via spec skips re-reading and
+    re-parsing the multi-MB JSON that was just written to disk.
+    """
+    # The three parses read different inputs and share no state, so their
+    # I/O and scanning overlap in a small pool: prelude wall-time becomes
+    # the max of the three instead of their sum.
+    print_info("Parsing oas_client_gen.go and spec operations...")
+    params_file = client_file.replace('oas_client_gen.go', 'oas_parameters_gen.go')
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        methods_future = pool.submit(
+            lambda: parse_oas_client_methods(Path(client_file).read_bytes()))
+        params_future = pool.submit(parse_params_structs, params_file)
+        if spec is not None:
+            operations_future = pool.submit(parse_operations, spec)
+        else:
+            operations_future = pool.submit(parse_operations_file, spec_file)
 
-                call_args = []
-                for i, (pname, ptype) in enumerate(params):
-                    if i == params_index:
-                        call_args.append(params_init)
-                    else:
-                        call_args.append(pname)
+        methods = methods_future.result()
+        params_structs = params_future.result()
+        operations_by_controller = operations_future.result()
 
-                code += f'''// {display_method} calls {op_id}.
-func (sc *{controller}Client) {display_method}(ctx context.Context, {simple_args}{opts_sig}) {ret_type} {{
-\treturn sc.client.{go_method}(ctx, {', '.join(call_args)}{opts_call})
-}}
+    print_success(f"Found {len(methods)} client methods")
+    print_success(f"Found {len(params_structs)} param structs")
+    total_ops = sum(len(ops) for ops in operations_by_controller.values())
+    print_success(f"Found {total_ops} operations in {len(operations_by_controller)} controllers")
+    
+    @functools.lru_cache(maxsize=None)
+    def can_simplify_params(params_type: str) -> tuple:
+        """
+        Check if Params struct can be simplified to individual arguments.
+        Returns (can_simplify, [(field_name, field_type, simple_type, safe_name), ...])
 
-'''
+        Memoized: many operations share the same Params struct (paginated
+        list endpoints especially), so the field scan runs once per distinct
+        type. The cache lives and dies with this closure, so a fresh
+        params_structs on the next call can't serve stale entries.
+        """
+        struct_name = params_type.lstrip('*')
+        if struct_name not in params_structs:
+            return False, ()
+        
+        fields = params_structs[struct_name]
+        if not fields:
+            return False, ()
+        
+        # Only simplify if all fields are simple types
+        simple_types = {'string', 'int', 'int64', 'float64', 'bool', 
+                       'OptString', 'OptInt', 'OptInt64', 'OptFloat64', 'OptBool'}
+        
+        simplified = []
+        for field_name, field_type in fields:
+            if field_type in simple_types or field_type.startswith('Opt'):
+                simple = simplify_param_type(field_type)
+                simplified.append((field_name, field_type, simple,
+                                   safe_param_name(field_name)))
             else:
-                # Original params
-                if params:
-                    params_sig = ', '.join([f'{p[0]} {p[1]}' for p in params])
-                    params_call = ', '.join([p[0] for p in params])
-                else:
-                    params_sig = ''
-                    params_call = ''
+                # Complex type, don't simplify
+                return False, ()
 
-                code += f'''// {display_method} calls {op_id}.
-func (sc *{controller}Client) {display_method}(ctx context.Context'''
+        # Tuple so the cached value handed to every caller is immutable
+        return True, tuple(simplified)
+    
+    # Sort once up front: controller order is reused by four emission passes
+    # and method order by the per-controller pass.
+    controllers = sorted(operations_by_controller)
+    ops_by_ctrl = {c: sorted(operations_by_controller[c], key=_GO_METHOD) for c in controllers}
+    field_names = {c: _to_camel(c) for c in controllers}
+
+    # Emit the generated source straight to disk: the output is write-once,
+    # so there is no need to materialize the whole file in memory first. The
+    # large buffer amortizes syscalls across the many small writes.
+    print_info(f"Writing {output_file}...")
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        code = f.write
+        code(_EXT_HEADER)
+    
+        for controller in controllers:
+            field_name = field_names[controller]
+            code(f'\t{field_name} *{controller}Client\n')
+    
+        code(_EXT_CONSTRUCTOR)
+    
+        for controller in controllers:
+            field_name = field_names[controller]
+            code(f'\t\t{field_name}: New{controller}Client(client),\n')
+    
+        code(_EXT_BASE_ACCESSOR)
+    
+        for controller in controllers:
+            code(_ACCESSOR_TMPL.format(c=controller, f=field_names[controller]))
+    
+        matched_methods = 0
 
-                if params_sig:
-                    code += f', {params_sig}'
+        # Identical parameter lists and return tuples repeat across many
+        # operations (every get-by-uuid shares a signature), so the formatted
+        # fragments are interned per distinct tuple instead of rebuilt per op.
+        sig_cache = {}
+        ret_cache = {}
 
-                code += opts_sig + ')'
+        for controller in controllers:
+            code(_CONTROLLER_TMPL.format(c=controller))
+        
+            for op in ops_by_ctrl[controller]:
+                go_method = op['goMethod']
+                method_info = methods.get(go_method)
+                if method_info is None:
+                    continue
 
-                if ret_type:
-                    code += f' {ret_type}'
+                display_method = op['displayMethod']
+                op_id = op['operationId']
+                matched_methods += 1
+                params = method_info['params']
+                returns = method_info['returns']
+                has_options = method_info.get('has_options', False)
 
-                code += ' {\n'
+                # options suffix for signature and call
+                opts_sig = ', options ...RequestOption' if has_options else ''
+                opts_call = ', options...' if has_options else ''
 
-                if returns:
-                    code += f'\treturn sc.client.{go_method}(ctx'
+                # Check if we can simplify Params struct to individual args
+                simplified_params = None
+                params_index = None
+                for i, (pname, ptype) in enumerate(params):
+                    if ptype.endswith('Params'):
+                        can_simplify, simplified = can_simplify_params(ptype)
+                        if can_simplify:
+                            simplified_params = simplified
+                            params_index = i
+                        break
+
+                ret_key = tuple(returns)
+                if ret_key in ret_cache:
+                    ret_type = ret_cache[ret_key]
                 else:
-                    code += f'\tsc.client.{go_method}(ctx'
+                    if returns:
+                        ret_type = ', '.join(returns)
+                        if len(returns) > 1:
+                            ret_type = f'({ret_type})'
+                    else:
+                        ret_type = ''
+                    ret_cache[ret_key] = ret_type
+
+                # Generate method with simplified params or original
+                if simplified_params and params_index is not None:
+                    params_type = params[params_index][1]
+
+                    sig_parts = []
+                    for i, (pname, ptype) in enumerate(params):
+                        if i == params_index:
+                            for field_name, field_type, simple_type, safe_name in simplified_params:
+                                sig_parts.append(f'{safe_name} {simple_type}')
+                        else:
+                            sig_parts.append(f'{pname} {ptype}')
+
+                    simple_args = ', '.join(sig_parts)
+
+                    params_init = f'{params_type}{{\n'
+                    for field_name, field_type, simple_type, arg_name in simplified_params:
+                        if field_type.startswith('Opt'):
+                            ctor = _OPT_CTOR.get(simple_type)
+                            if ctor is None:
+                                ctor = f'NewOpt{simple_type.title()}'
+                            params_init += f'\t\t{field_name}: {ctor}({arg_name}),\n'
+                        else:
+                            params_init += f'\t\t{field_name}: {arg_name},\n'
+                    params_init += '\t}'
+
+                    call_args = []
+                    for i, (pname, ptype) in enumerate(params):
+                        if i == params_index:
+                            call_args.append(params_init)
+                        else:
+                            call_args.append(pname)
+
+                    code(f'''// {display_method} calls {op_id}.
+func (sc *{controller}Client) {display_method}(ctx context.Context, {simple_args}{opts_sig}) {ret_type} {{
+\treturn sc.client.{go_method}(ctx, {', '.join(call_args)}{opts_call})
+}}
 
-                if params_call:
-                    code += f', {params_call}'
+''')
+                else:
+                    # Original params. Emit the whole method as one f-string:
+                    # the optional pieces fold into conditional expressions, so
+                    # each method costs a single format-and-write instead of
+                    # half a dozen small concatenations.
+                    sig_key = tuple(params)
+                    if sig_key in sig_cache:
+                        sig, call = sig_cache[sig_key]
+                    else:
+                        if params:
+                            sig = ', ' + ', '.join([f'{p[0]} {p[1]}' for p in params])
+                            call = ', ' + ', '.join([p[0] for p in params])
+                        else:
+                            sig = ''
+                            call = ''
+                        sig_cache[sig_key] = (sig, call)
+                    rt = f' {ret_type}' if ret_type else ''
+                    ret_kw = 'return ' if returns else ''
+
+                    code(f'''// {display_method} calls {op_id}.
+func (sc *{controller}Client) {display_method}(ctx context.Context{sig}{opts_sig}){rt} {{
+\t{ret_kw}sc.client.{go_method}(ctx{call}{opts_call})
+}}
 
-                code += opts_call + ')\n}\n\n'
+''')
     
-    print_info(f"Writing {output_file}...")
-    with open(output_file, 'w') as f:
-        f.write(code)
     
     print_success(f"Generated {matched_methods}/{total_ops} methods")
     
@@ -702,85 +1030,112 @@ func (sc *{controller}Client) {display_method}(ctx context.Context'''
 # MAIN PIPELINE
 # ============================================================================
 
+def consolidate_spec(input_spec):
+    """Consolidate + post-process one spec and write its -final.json.
+
+    This is the CPU-heavy Python stage, split out so multi-file runs can
+    fan it out across a process pool. Returns the final file path, the
+    counters for the summary, and the processed spec itself.
+    """
+    final_file = input_spec.replace('.json', '-final.json')
+
+    # Smart consolidate (combines old Steps 1 & 2).
+    # The spec stays in memory through post-processing and is written once.
+    orig_count, new_count, stats, final_spec = smart_consolidate_schemas(input_spec)
+
+    print_info("Post-processing consolidated spec...")
+
+    patched_count = patch_subscription_text_responses(final_spec)
+    if patched_count > 0:
+        print_success(f"Patched {patched_count} subscription endpoints with text/plain response")
+
+    renamed_count = shorten_operation_ids(final_spec)
+    if renamed_count > 0:
+        print_success(f"Shortened {renamed_count} operationIds (removed 'Controller')")
+
+    dto_count = strip_dto_suffix(final_spec)
+    if dto_count > 0:
+        print_success(f"Stripped 'Dto' suffix from {dto_count} schema names")
+
+    int_count = fix_number_query_params(final_spec)
+    if int_count > 0:
+        print_success(f"Fixed {int_count} query parameters: number → integer")
+
+    if orjson is not None:
+        # C encoder; orjson always emits UTF-8 so ensure_ascii=False is implicit
+        with open(final_file, 'wb', buffering=65536) as f:
+            f.write(orjson.dumps(final_spec, option=orjson.OPT_INDENT_2))
+    else:
+        with open(final_file, 'w') as f:
+            json.dump(final_spec, f, indent=2, ensure_ascii=False)
+
+    return final_file, orig_count, new_count, stats, final_spec
+
+
 def main():
     if len(sys.argv) < 2:
-        print_error("Usage: python3 pipeline.py <input_spec.json>")
+        print_error("Usage: python3 pipeline.py <input_spec.json> [more_specs.json ...]")
         sys.exit(1)
-    
-    input_spec = sys.argv[1]
-    
-    if not Path(input_spec).exists():
-        print_error(f"File not found: {input_spec}")
-        sys.exit(1)
-    
+
+    input_specs = sys.argv[1:]
+
+    for input_spec in input_specs:
+        if not Path(input_spec).exists():
+            print_error(f"File not found: {input_spec}")
+            sys.exit(1)
+
     print(f"{Colors.BOLD}{Colors.HEADER}")
     print("="*70)
     print(" API PROCESSING PIPELINE")
     print("="*70)
     print(f"{Colors.END}")
-    print(f"Input: {input_spec}")
-    
-    # File paths - now we only need one output file since smart_consolidate does both steps
-    final_file = input_spec.replace('.json', '-final.json')
+    print(f"Input: {', '.join(input_specs)}")
+
     client_gen_file = 'api/oas_client_gen.go'
     client_ext_file = 'api/client_ext.go'
-    
+
     try:
-        # Step 1: Smart consolidate (combines old Steps 1 & 2)
+        # Step 1: Smart consolidate + post-process.
+        # Each spec is independent here, so multi-file runs fan out over a
+        # process pool. Codegen stays sequential: ogen and client_ext both
+        # write into the shared api/ directory.
         print_step(1, 3, "SMART CONSOLIDATE SCHEMAS")
-        orig_count, new_count, stats = smart_consolidate_schemas(input_spec, final_file)
-        
-        # Step 1.5: Post-process the consolidated spec (in-memory)
-        print_info("Post-processing consolidated spec...")
-        with open(final_file, 'r') as f:
-            final_spec = json.load(f)
-
-        patched_count = patch_subscription_text_responses(final_spec)
-        if patched_count > 0:
-            print_success(f"Patched {patched_count} subscription endpoints with text/plain response")
-
-        renamed_count = shorten_operation_ids(final_spec)
-        if renamed_count > 0:
-            print_success(f"Shortened {renamed_count} operationIds (removed 'Controller')")
-
-        dto_count = strip_dto_suffix(final_spec)
-        if dto_count > 0:
-            print_success(f"Stripped 'Dto' suffix from {dto_count} schema names")
-
-        int_count = fix_number_query_params(final_spec)
-        if int_count > 0:
-            print_success(f"Fixed {int_count} query parameters: number → integer")
-
-        with open(final_file, 'w') as f:
-            json.dump(final_spec, f, indent=2, ensure_ascii=False)
+        if len(input_specs) == 1:
+            results = [consolidate_spec(input_specs[0])]
+        else:
+            workers = min(len(input_specs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(consolidate_spec, input_specs))
+
+        for final_file, orig_count, new_count, stats, final_spec in results:
+            # Step 2: Generate with ogen
+            print_step(2, 3, "GENERATE GO CLIENT WITH OGEN")
+            if not generate_ogen_client(final_file):
+                print_error("Failed to generate Go client")
+                sys.exit(1)
+
+            # Step 3: Generate client_ext
+            print_step(3, 3, "GENERATE CLIENT_EXT.GO WRAPPER")
+            ctrl_count, method_count = generate_client_ext(final_file, client_gen_file, client_ext_file,
+                                                           spec=final_spec)
+
+            # Summary
+            print(f"\n{Colors.BOLD}{Colors.GREEN}")
+            print("="*70)
+            print(" PIPELINE COMPLETED SUCCESSFULLY")
+            print("="*70)
+            print(f"{Colors.END}")
+            print(f"\n{Colors.BOLD}Results:{Colors.END}")
+            print(f"  • Schemas:     {orig_count} → {new_count} (-{orig_count - new_count}, -{(orig_count-new_count)*100//orig_count}%)")
+            print(f"  • Groups:      {stats.get('duplicate_groups', 0)} consolidated")
+            print(f"  • Controllers: {ctrl_count}")
+            print(f"  • Methods:     {method_count}")
+            print(f"\n{Colors.BOLD}Generated files:{Colors.END}")
+            print(f"  • {final_file}")
+            print(f"  • {client_gen_file}")
+            print(f"  • {client_ext_file}")
+            print()
 
-        # Step 2: Generate with ogen
-        print_step(2, 3, "GENERATE GO CLIENT WITH OGEN")
-        if not generate_ogen_client(final_file):
-            print_error("Failed to generate Go client")
-            sys.exit(1)
-        
-        # Step 3: Generate client_ext
-        print_step(3, 3, "GENERATE CLIENT_EXT.GO WRAPPER")
-        ctrl_count, method_count = generate_client_ext(final_file, client_gen_file, client_ext_file)
-        
-        # Summary
-        print(f"\n{Colors.BOLD}{Colors.GREEN}")
-        print("="*70)
-        print(" PIPELINE COMPLETED SUCCESSFULLY")
-        print("="*70)
-        print(f"{Colors.END}")
-        print(f"\n{Colors.BOLD}Results:{Colors.END}")
-        print(f"  • Schemas:     {orig_count} → {new_count} (-{orig_count - new_count}, -{(orig_count-new_count)*100//orig_count}%)")
-        print(f"  • Groups:      {stats.get('duplicate_groups', 0)} consolidated")
-        print(f"  • Controllers: {ctrl_count}")
-        print(f"  • Methods:     {method_count}")
-        print(f"\n{Colors.BOLD}Generated files:{Colors.END}")
-        print(f"  • {final_file}")
-        print(f"  • {client_gen_file}")
-        print(f"  • {client_ext_file}")
-        print()
-        
     except Exception as e:
         print_error(f"Pipeline failed: {e}")
         import traceback
@@ -11,226 +11,425 @@ Changes patterns like:
 """
 
 import json
+import re
 import sys
+from collections import deque
 from pathlib import Path
 
+try:
+    import orjson  # optional: C-level JSON parse, 3-10x stdlib on big specs
+except ImportError:
+    orjson = None
+
+# $ref prefix for component schemas; fixed length so names can be sliced off
+SCHEMA_REF_PREFIX = '#/components/schemas/'
+SCHEMA_REF_PREFIX_LEN = len(SCHEMA_REF_PREFIX)
+
+
+def _intern_keys(d: dict) -> dict:
+    """json.load object_hook: intern dict keys so the tens of thousands of
+    repeated spec keys share one str object each (less RSS, pointer-equal
+    compares during the $ref walk)."""
+    return {sys.intern(k): v for k, v in d.items()}
+
+
+# Old -> new schema names. Built once at import so repeated calls (and
+# callers importing this as a library) share one dict.
+_RENAME_MAP = {
+    # User responses (9 schemas)
+    'CreateUserResponseDto': 'UserResponse',
+    'DisableUserResponseDto': 'UserResponse',
+    'EnableUserResponseDto': 'UserResponse',
+    'GetUserByShortUuidResponseDto': 'UserResponse',
+    'GetUserByUsernameResponseDto': 'UserResponse',
+    'GetUserByUuidResponseDto': 'UserResponse',
+    'ResetUserTrafficResponseDto': 'UserResponse',
+    'RevokeUserSubscriptionResponseDto': 'UserResponse',
+    'UpdateUserResponseDto': 'UserResponse',
+    
+    # Delete operations (8 schemas)
+    'DeleteConfigProfileResponseDto': 'DeleteResponse',
+    'DeleteExternalSquadResponseDto': 'DeleteResponse',
+    'DeleteHostResponseDto': 'DeleteResponse',
+    'DeleteInfraProviderByUuidResponseDto': 'DeleteResponse',
+    'DeleteInternalSquadResponseDto': 'DeleteResponse',
+    'DeleteNodeResponseDto': 'DeleteResponse',
+    'DeleteSubscriptionTemplateResponseDto': 'DeleteResponse',
+    'DeleteUserResponseDto': 'DeleteResponse',
+    'DeletePasskeyResponseDto': 'DeleteResponse',
+    
+    # Event operations (8 schemas)
+    'AddUsersToExternalSquadResponseDto': 'EventResponse',
+    'AddUsersToInternalSquadResponseDto': 'EventResponse',
+    'BulkAllResetTrafficUsersResponseDto': 'EventResponse',
+    'BulkAllUpdateUsersResponseDto': 'EventResponse',
+    'RemoveUsersFromExternalSquadResponseDto': 'EventResponse',
+    'RemoveUsersFromInternalSquadResponseDto': 'EventResponse',
+    'RestartAllNodesResponseDto': 'EventResponse',
+    'RestartNodeResponseDto': 'EventResponse',
+    
+    # Bulk responses (6 schemas)
+    'BulkDeleteUsersByStatusResponseDto': 'BulkActionResponse',
+    'BulkDeleteUsersResponseDto': 'BulkActionResponse',
+    'BulkResetTrafficUsersResponseDto': 'BulkActionResponse',
+    'BulkRevokeUsersSubscriptionResponseDto': 'BulkActionResponse',
+    'BulkUpdateUsersResponseDto': 'BulkActionResponse',
+    'BulkUpdateUsersSquadsResponseDto': 'BulkActionResponse',
+    
+    # Bulk requests (6 schemas)
+    'BulkDeleteHostsRequestDto': 'BulkUuidsRequest',
+    'BulkDisableHostsRequestDto': 'BulkUuidsRequest',
+    'BulkEnableHostsRequestDto': 'BulkUuidsRequest',
+    'BulkResetTrafficUsersRequestDto': 'BulkUuidsRequest',
+    'BulkRevokeUsersSubscriptionRequestDto': 'BulkUuidsRequest',
+    'BulkUuidsRequestDto': 'BulkUuidsRequest',
+    
+    # Hosts (6 schemas)
+    'BulkDeleteHostsResponseDto': 'HostListResponse',
+    'BulkDisableHostsResponseDto': 'HostListResponse',
+    'BulkEnableHostsResponseDto': 'HostListResponse',
+    'GetAllHostsResponseDto': 'HostListResponse',
+    'SetInboundToManyHostsResponseDto': 'HostListResponse',
+    'SetPortToManyHostsResponseDto': 'HostListResponse',
+    
+    # Auth tokens (5 schemas)
+    'LoginResponseDto': 'TokenResponse',
+    'OAuth2CallbackResponseDto': 'TokenResponse',
+    'RegisterResponseDto': 'TokenResponse',
+    'TelegramCallbackResponseDto': 'TokenResponse',
+    'VerifyPasskeyAuthenticationResponseDto': 'TokenResponse',
+    
+    # Node responses (5 schemas)
+    'CreateNodeResponseDto': 'NodeResponse',
+    'DisableNodeResponseDto': 'NodeResponse',
+    'EnableNodeResponseDto': 'NodeResponse',
+    'GetOneNodeResponseDto': 'NodeResponse',
+    'UpdateNodeResponseDto': 'NodeResponse',
+    
+    # Passkey/Auth
+    'GetPasskeyRegistrationOptionsResponseDto': 'PasskeyOptionsResponse',
+    'GetPasskeyAuthenticationOptionsResponseDto': 'PasskeyOptionsResponse',
+    'VerifyPasskeyAuthenticationRequestDto': 'PasskeyOptionsResponse',
+    'VerifyPasskeyRegistrationRequestDto': 'PasskeyOptionsResponse',
+    
+    # Subscriptions (4 schemas)
+    'GetSubscriptionByShortUuidProtectedResponseDto': 'SubscriptionResponse',
+    'GetSubscriptionByUsernameResponseDto': 'SubscriptionResponse',
+    'GetSubscriptionByUuidResponseDto': 'SubscriptionResponse',
+    'GetSubscriptionInfoResponseDto': 'SubscriptionResponse',
+    
+    # Snippets (4 schemas)
+    'CreateSnippetResponseDto': 'SnippetsResponse',
+    'DeleteSnippetResponseDto': 'SnippetsResponse',
+    'GetSnippetsResponseDto': 'SnippetsResponse',
+    'UpdateSnippetResponseDto': 'SnippetsResponse',
+    
+    # HWID Devices (4 schemas)
+    'CreateUserHwidDeviceResponseDto': 'HwidDevicesResponse',
+    'DeleteAllUserHwidDevicesResponseDto': 'HwidDevicesResponse',
+    'DeleteUserHwidDeviceResponseDto': 'HwidDevicesResponse',
+    'GetUserHwidDevicesResponseDto': 'HwidDevicesResponse',
+    
+    # Billing Nodes (4 schemas)
+    'CreateInfraBillingNodeResponseDto': 'BillingNodesResponse',
+    'DeleteInfraBillingNodeByUuidResponseDto': 'BillingNodesResponse',
+    'GetInfraBillingNodesResponseDto': 'BillingNodesResponse',
+    'UpdateInfraBillingNodeResponseDto': 'BillingNodesResponse',
+    
+    # Other mappings for remaining schemas
+    'GetUserByEmailResponseDto': 'UsersResponse',
+    'GetUserByTagResponseDto': 'UsersResponse',
+    'GetUserByTelegramIdResponseDto': 'UsersResponse',
+    
+    'CreateSubscriptionTemplateResponseDto': 'TemplateResponse',
+    'GetTemplateResponseDto': 'TemplateResponse',
+    'UpdateTemplateResponseDto': 'TemplateResponse',
+    
+    'CreateConfigProfileResponseDto': 'ConfigProfileResponse',
+    'GetConfigProfileByUuidResponseDto': 'ConfigProfileResponse',
+    'UpdateConfigProfileResponseDto': 'ConfigProfileResponse',
+    
+    'CreateInternalSquadResponseDto': 'InternalSquadResponse',
+    'GetInternalSquadByUuidResponseDto': 'InternalSquadResponse',
+    'UpdateInternalSquadResponseDto': 'InternalSquadResponse',
+    
+    'CreateExternalSquadResponseDto': 'ExternalSquadResponse',
+    'GetExternalSquadByUuidResponseDto': 'ExternalSquadResponse',
+    'UpdateExternalSquadResponseDto': 'ExternalSquadResponse',
+    
+    'CreateHostResponseDto': 'HostResponse',
+    'GetOneHostResponseDto': 'HostResponse',
+    'UpdateHostResponseDto': 'HostResponse',
+    
+    'CreateInfraProviderResponseDto': 'InfraProviderResponse',
+    'GetInfraProviderByUuidResponseDto': 'InfraProviderResponse',
+    'UpdateInfraProviderResponseDto': 'InfraProviderResponse',
+    
+    'CreateInfraBillingHistoryRecordResponseDto': 'BillingHistoryResponse',
+    'DeleteInfraBillingHistoryRecordByUuidResponseDto': 'BillingHistoryResponse',
+    'GetInfraBillingHistoryRecordsResponseDto': 'BillingHistoryResponse',
+    
+    'GetRemnawaveSettingsResponseDto': 'SettingsResponse',
+    'UpdateRemnawaveSettingsResponseDto': 'SettingsResponse',
+    
+    'GetAllPasskeysResponseDto': 'PasskeysResponse',
+    
+    'GetAllTagsResponseDto': 'TagsResponse',
+    'GetAllHostTagsResponseDto': 'TagsResponse',
+    
+    'GetAllInboundsResponseDto': 'InboundsResponse',
+    'GetInboundsByProfileUuidResponseDto': 'InboundsResponse',
+    
+    'CreateSnippetRequestDto': 'SnippetRequest',
+    'UpdateSnippetRequestDto': 'SnippetRequest',
+    
+    'GetAllNodesResponseDto': 'NodesResponse',
+    'ReorderNodeResponseDto': 'NodesResponse',
+    
+    'GetSubscriptionSettingsResponseDto': 'SubscriptionSettingsResponse',
+    'UpdateSubscriptionSettingsResponseDto': 'SubscriptionSettingsResponse',
+}
+
 
 def create_rename_map() -> dict:
     """Create mapping from old names to new common names."""
-    return {
-        # User responses (9 schemas)
-        'CreateUserResponseDto': 'UserResponse',
-        'DisableUserResponseDto': 'UserResponse',
-        'EnableUserResponseDto': 'UserResponse',
-        'GetUserByShortUuidResponseDto': 'UserResponse',
-        'GetUserByUsernameResponseDto': 'UserResponse',
-        'GetUserByUuidResponseDto': 'UserResponse',
-        'ResetUserTrafficResponseDto': 'UserResponse',
-        'RevokeUserSubscriptionResponseDto': 'UserResponse',
-        'UpdateUserResponseDto': 'UserResponse',
-        
-        # Delete operations (8 schemas)
-        'DeleteConfigProfileResponseDto': 'DeleteResponse',
-        'DeleteExternalSquadResponseDto': 'DeleteResponse',
-        'DeleteHostResponseDto': 'DeleteResponse',
-        'DeleteInfraProviderByUuidResponseDto': 'DeleteResponse',
-        'DeleteInternalSquadResponseDto': 'DeleteResponse',
-        'DeleteNodeResponseDto': 'DeleteResponse',
-        'DeleteSubscriptionTemplateResponseDto': 'DeleteResponse',
-        'DeleteUserResponseDto': 'DeleteResponse',
-        'DeletePasskeyResponseDto': 'DeleteResponse',
-        
-        # Event operations (8 schemas)
-        'AddUsersToExternalSquadResponseDto': 'EventResponse',
-        'AddUsersToInternalSquadResponseDto': 'EventResponse',
-        'BulkAllResetTrafficUsersResponseDto': 'EventResponse',
-        'BulkAllUpdateUsersResponseDto': 'EventResponse',
-        'RemoveUsersFromExternalSquadResponseDto': 'EventResponse',
-        'RemoveUsersFromInternalSquadResponseDto': 'EventResponse',
-        'RestartAllNodesResponseDto': 'EventResponse',
-        'RestartNodeResponseDto': 'EventResponse',
-        
-        # Bulk responses (6 schemas)
-        'BulkDeleteUsersByStatusResponseDto': 'BulkActionResponse',
-        'BulkDeleteUsersResponseDto': 'BulkActionResponse',
-        'BulkResetTrafficUsersResponseDto': 'BulkActionResponse',
-        'BulkRevokeUsersSubscriptionResponseDto': 'BulkActionResponse',
-        'BulkUpdateUsersResponseDto': 'BulkActionResponse',
-        'BulkUpdateUsersSquadsResponseDto': 'BulkActionResponse',
-        
-        # Bulk requests (6 schemas)
-        'BulkDeleteHostsRequestDto': 'BulkUuidsRequest',
-        'BulkDisableHostsRequestDto': 'BulkUuidsRequest',
-        'BulkEnableHostsRequestDto': 'BulkUuidsRequest',
-        'BulkResetTrafficUsersRequestDto': 'BulkUuidsRequest',
-        'BulkRevokeUsersSubscriptionRequestDto': 'BulkUuidsRequest',
-        'BulkUuidsRequestDto': 'BulkUuidsRequest',
-        
-        # Hosts (6 schemas)
-        'BulkDeleteHostsResponseDto': 'HostListResponse',
-        'BulkDisableHostsResponseDto': 'HostListResponse',
-        'BulkEnableHostsResponseDto': 'HostListResponse',
-        'GetAllHostsResponseDto': 'HostListResponse',
-        'SetInboundToManyHostsResponseDto': 'HostListResponse',
-        'SetPortToManyHostsResponseDto': 'HostListResponse',
-        
-        # Auth tokens (5 schemas)
-        'LoginResponseDto': 'TokenResponse',
-        'OAuth2CallbackResponseDto': 'TokenResponse',
-        'RegisterResponseDto': 'TokenResponse',
-        'TelegramCallbackResponseDto': 'TokenResponse',
-        'VerifyPasskeyAuthenticationResponseDto': 'TokenResponse',
-        
-        # Node responses (5 schemas)
-        'CreateNodeResponseDto': 'NodeResponse',
-        'DisableNodeResponseDto': 'NodeResponse',
-        'EnableNodeResponseDto': 'NodeResponse',
-        'GetOneNodeResponseDto': 'NodeResponse',
-        'UpdateNodeResponseDto': 'NodeResponse',
-        
-        # Passkey/Auth
-        'GetPasskeyRegistrationOptionsResponseDto': 'PasskeyOptionsResponse',
-        'GetPasskeyAuthenticationOptionsResponseDto': 'PasskeyOptionsResponse',
-        'VerifyPasskeyAuthenticationRequestDto': 'PasskeyOptionsResponse',
-        'VerifyPasskeyRegistrationRequestDto': 'PasskeyOptionsResponse',
-        
-        # Subscriptions (4 schemas)
-        'GetSubscriptionByShortUuidProtectedResponseDto': 'SubscriptionResponse',
-        'GetSubscriptionByUsernameResponseDto': 'SubscriptionResponse',
-        'GetSubscriptionByUuidResponseDto': 'SubscriptionResponse',
-        'GetSubscriptionInfoResponseDto': 'SubscriptionResponse',
-        
-        # Snippets (4 schemas)
-        'CreateSnippetResponseDto': 'SnippetsResponse',
-        'DeleteSnippetResponseDto': 'SnippetsResponse',
-        'GetSnippetsResponseDto': 'SnippetsResponse',
-        'UpdateSnippetResponseDto': 'SnippetsResponse',
-        
-        # HWID Devices (4 schemas)
-        'CreateUserHwidDeviceResponseDto': 'HwidDevicesResponse',
-        'DeleteAllUserHwidDevicesResponseDto': 'HwidDevicesResponse',
-        'DeleteUserHwidDeviceResponseDto': 'HwidDevicesResponse',
-        'GetUserHwidDevicesResponseDto': 'HwidDevicesResponse',
-        
-        # Billing Nodes (4 schemas)
-        'CreateInfraBillingNodeResponseDto': 'BillingNodesResponse',
-        'DeleteInfraBillingNodeByUuidResponseDto': 'BillingNodesResponse',
-        'GetInfraBillingNodesResponseDto': 'BillingNodesResponse',
-        'UpdateInfraBillingNodeResponseDto': 'BillingNodesResponse',
-        
-        # Other mappings for remaining schemas
-        'GetUserByEmailResponseDto': 'UsersResponse',
-        'GetUserByTagResponseDto': 'UsersResponse',
-        'GetUserByTelegramIdResponseDto': 'UsersResponse',
-        
-        'CreateSubscriptionTemplateResponseDto': 'TemplateResponse',
-        'GetTemplateResponseDto': 'TemplateResponse',
-        'UpdateTemplateResponseDto': 'TemplateResponse',
-        
-        'CreateConfigProfileResponseDto': 'ConfigProfileResponse',
-        'GetConfigProfileByUuidResponseDto': 'ConfigProfileResponse',
-        'UpdateConfigProfileResponseDto': 'ConfigProfileResponse',
-        
-        'CreateInternalSquadResponseDto': 'InternalSquadResponse',
-        'GetInternalSquadByUuidResponseDto': 'InternalSquadResponse',
-        'UpdateInternalSquadResponseDto': 'InternalSquadResponse',
-        
-        'CreateExternalSquadResponseDto': 'ExternalSquadResponse',
-        'GetExternalSquadByUuidResponseDto': 'ExternalSquadResponse',
-        'UpdateExternalSquadResponseDto': 'ExternalSquadResponse',
-        
-        'CreateHostResponseDto': 'HostResponse',
-        'GetOneHostResponseDto': 'HostResponse',
-        'UpdateHostResponseDto': 'HostResponse',
-        
-        'CreateInfraProviderResponseDto': 'InfraProviderResponse',
-        'GetInfraProviderByUuidResponseDto': 'InfraProviderResponse',
-        'UpdateInfraProviderResponseDto': 'InfraProviderResponse',
-        
-        'CreateInfraBillingHistoryRecordResponseDto': 'BillingHistoryResponse',
-        'DeleteInfraBillingHistoryRecordByUuidResponseDto': 'BillingHistoryResponse',
-        'GetInfraBillingHistoryRecordsResponseDto': 'BillingHistoryResponse',
-        
-        'GetRemnawaveSettingsResponseDto': 'SettingsResponse',
-        'UpdateRemnawaveSettingsResponseDto': 'SettingsResponse',
-        
-        'GetAllPasskeysResponseDto': 'PasskeysResponse',
-        
-        'GetAllTagsResponseDto': 'TagsResponse',
-        'GetAllHostTagsResponseDto': 'TagsResponse',
-        
-        'GetAllInboundsResponseDto': 'InboundsResponse',
-        'GetInboundsByProfileUuidResponseDto': 'InboundsResponse',
-        
-        'CreateSnippetRequestDto': 'SnippetRequest',
-        'UpdateSnippetRequestDto': 'SnippetRequest',
-        
-        'GetAllNodesResponseDto': 'NodesResponse',
-        'ReorderNodeResponseDto': 'NodesResponse',
-        
-        'GetSubscriptionSettingsResponseDto': 'SubscriptionSettingsResponse',
-        'UpdateSubscriptionSettingsResponseDto': 'SubscriptionSettingsResponse',
-    }
-
-
-def rename_schemas_in_spec(spec: dict, rename_map: dict) -> dict:
-    """Rename all schemas in the OpenAPI spec."""
+    return _RENAME_MAP
+
+
+def _compile_ref_rewriter(full_ref_map: dict):
+    """Generate a rewriter specialized for this exact ref map.
+
+    The map is fixed at script start, so instead of a dict probe per $ref
+    the walker calls a function whose body is a plain if/elif chain of
+    LOAD_CONST string comparisons — for under ~200 entries that beats
+    hashing the full 40-odd-char ref string on every node.
+    """
+    lines = ['def _rewrite(v):']
+    for old, new in full_ref_map.items():
+        lines.append(f'    if v == {old!r}:')
+        lines.append(f'        return {new!r}')
+    lines.append('    return v')
+    ns = {}
+    exec(compile('\n'.join(lines), '<ref-rewriter>', 'exec'), ns)
+    return ns['_rewrite']
+
+
+def apply_renames(spec: dict, rename_map: dict) -> dict:
+    """Rename components.schemas keys and rewrite every $ref in one pass.
+
+    The key rename and the $ref rewrite used to be separate calls; fusing
+    them means the spec tree is set up and traversed once. The walk itself
+    is an iterative worklist instead of recursion: no Python frame per node,
+    and scalars are never pushed at all.
+    """
+    # Rename in place: O(|rename_map|) pops instead of rebuilding (and
+    # rehashing) the full schemas table. When several old names map to one
+    # new name the first wins; the dropped bodies are duplicates of it by
+    # construction.
     schemas = spec.get('components', {}).get('schemas', {})
-    
-    new_schemas = {}
-    for old_name, schema_def in schemas.items():
-        new_name = rename_map.get(old_name, old_name)
-        new_schemas[new_name] = schema_def
-    
-    spec['components']['schemas'] = new_schemas
+    for old_name, new_name in rename_map.items():
+        if new_name == old_name or old_name not in schemas:
+            continue
+        schemas.setdefault(new_name, schemas.pop(old_name))
+
+    # Keying on the full ref string turns the per-node prefix strip and
+    # concat into a single dict probe; refs outside the map stay untouched.
+    # Interning the keys/values caches their hashes, so probes against
+    # already-interned ref strings short-circuit to pointer comparisons.
+    full_ref_map = {sys.intern(SCHEMA_REF_PREFIX + old): sys.intern(SCHEMA_REF_PREFIX + new)
+                    for old, new in rename_map.items()}
+    rewrite = _compile_ref_rewriter(full_ref_map)
+    stack = deque([spec])
+    while stack:
+        obj = stack.pop()
+        if type(obj) is dict:
+            if '$ref' in obj:
+                ref = obj['$ref']
+                if type(ref) is str:
+                    obj['$ref'] = rewrite(ref)
+                # A $ref object is opaque per OpenAPI — siblings are
+                # description/summary noise, so don't descend into them
+                continue
+            for value in obj.values():
+                if type(value) is dict or type(value) is list:
+                    stack.append(value)
+        else:
+            stack.extend(item for item in obj if type(item) is dict or type(item) is list)
     return spec
 
 
-def update_schema_references(spec: dict, rename_map: dict) -> dict:
-    """Update all $ref references to use new schema names."""
-    
-    def replace_refs(obj):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key == '$ref' and isinstance(value, str):
-                    if value.startswith('#/components/schemas/'):
-                        old_name = value.replace('#/components/schemas/', '')
-                        new_name = rename_map.get(old_name, old_name)
-                        obj[key] = f'#/components/schemas/{new_name}'
-                else:
-                    replace_refs(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                replace_refs(item)
-    
-    replace_refs(spec)
-    return spec
+_QUOTE, _BACKSLASH = 0x22, 0x5C
+_LBRACE, _RBRACE, _LBRACKET, _RBRACKET = 0x7B, 0x7D, 0x5B, 0x5D
+_COLON, _COMMA = 0x3A, 0x2C
+_JSON_WS = frozenset(b' \t\r\n')
+
+
+def _skip_string(data: bytes, i: int) -> int:
+    """With i at an opening quote, return the index just past the close."""
+    i += 1
+    while True:
+        c = data[i]
+        if c == _BACKSLASH:
+            i += 2
+        elif c == _QUOTE:
+            return i + 1
+        else:
+            i += 1
+
+
+def _skip_value(data: bytes, i: int) -> int:
+    """With i at the first byte of a JSON value, return the index past it."""
+    c = data[i]
+    if c == _QUOTE:
+        return _skip_string(data, i)
+    if c == _LBRACE or c == _LBRACKET:
+        depth = 0
+        while True:
+            c = data[i]
+            if c == _QUOTE:
+                i = _skip_string(data, i)
+                continue
+            if c == _LBRACE or c == _LBRACKET:
+                depth += 1
+            elif c == _RBRACE or c == _RBRACKET:
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+    # Scalar: number / true / false / null
+    while data[i] != _COMMA and data[i] != _RBRACE and data[i] != _RBRACKET \
+            and data[i] not in _JSON_WS:
+        i += 1
+    return i
+
+
+def _dedupe_schema_keys(data: bytes) -> bytes:
+    """Drop duplicate top-level members of components.schemas, keeping the first.
+
+    After a many-to-one key rename over unconsolidated input, several
+    members can share the new name. On consolidated input their bodies are
+    identical, so the later ones are pure duplicates that would only make
+    the output depend on the parser's duplicate-key policy; keeping the
+    first in document order mirrors the tree mode's setdefault.
+    """
+    idx = data.find(b'"components"')
+    if idx < 0:
+        return data
+    idx = data.find(b'"schemas"', idx)
+    if idx < 0:
+        return data
+    body_start = data.index(b'{', idx + len(b'"schemas"')) + 1
+
+    members = []
+    seen = set()
+    dropped = False
+    i = body_start
+    while True:
+        seg_start = i
+        while data[i] in _JSON_WS:
+            i += 1
+        if data[i] == _RBRACE:
+            closing = data[seg_start:i]
+            body_end = i
+            break
+        key_end = _skip_string(data, i)
+        key = data[i + 1:key_end - 1]
+        i = key_end
+        while data[i] in _JSON_WS:
+            i += 1
+        i += 1  # colon
+        while data[i] in _JSON_WS:
+            i += 1
+        i = _skip_value(data, i)
+        if key in seen:
+            dropped = True
+        else:
+            seen.add(key)
+            members.append(data[seg_start:i])
+        while data[i] in _JSON_WS:
+            i += 1
+        if data[i] == _COMMA:
+            i += 1
+
+    if not dropped:
+        return data
+    return data[:body_start] + b','.join(members) + closing + data[body_end:]
+
+
+def rename_text_mode(input_file: str, output_file: str, rename_map: dict) -> None:
+    """Rename schemas by regex substitution over the raw JSON bytes.
+
+    One C-level scan replaces both the schema keys and the
+    '#/components/schemas/...' refs without ever parsing the document into
+    a Python tree — the output bytes are otherwise identical to the input.
+    The rename map is many-to-one, so on unconsolidated input the key
+    rewrite can produce several schemas members with the same name; a
+    dedupe pass keeps only the first of each in document order so the
+    artifact never carries duplicate keys.
+    Caveat: a plain string value that exactly equals an old schema name
+    would also be rewritten, so this stays opt-in behind --text-mode.
+    """
+    with open(input_file, 'rb') as f:
+        data = f.read()
+
+    name_map = {old.encode(): new.encode() for old, new in rename_map.items()}
+    pattern = re.compile(
+        rb'"(#/components/schemas/)?(' + b'|'.join(map(re.escape, sorted(name_map))) + rb')"')
+
+    def repl(m):
+        prefix = m.group(1) or b''
+        return b'"' + prefix + name_map[m.group(2)] + b'"'
+
+    with open(output_file, 'wb') as f:
+        f.write(_dedupe_schema_keys(pattern.sub(repl, data)))
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 rename_schemas.py <input_file> [output_file]")
+        print("Usage: python3 rename_schemas.py [--text-mode] [--pretty] <input_file> [output_file]")
         print("Example: python3 rename_schemas.py api-2-2-2-consolidated.json api-2-2-2-renamed.json")
         sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.json', '-renamed.json')
+
+    flags = {a for a in sys.argv[1:] if a in ('--text-mode', '--pretty')}
+    args = [a for a in sys.argv[1:] if a not in flags]
+    text_mode = '--text-mode' in flags
+    pretty = '--pretty' in flags
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else input_file.replace('.json', '-renamed.json')
+
+    if text_mode:
+        print(f"📂 Rewriting {input_file} in text mode...")
+        rename_text_mode(input_file, output_file, create_rename_map())
+        print(f"✅ Done! Renamed schemas saved to {output_file}")
+        return
     
     print(f"📂 Loading {input_file}...")
-    with open(input_file, 'r') as f:
-        spec = json.load(f)
+    with open(input_file, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        spec = orjson.loads(raw)
+    else:
+        spec = json.loads(raw, object_hook=_intern_keys)
+    del raw
     
     rename_map = create_rename_map()
     
-    print(f"🔄 Renaming {len(rename_map)} schemas to common names...")
-    spec = rename_schemas_in_spec(spec, rename_map)
-    
-    print(f"🔗 Updating all schema references...")
-    spec = update_schema_references(spec, rename_map)
+    print(f"🔄 Renaming {len(rename_map)} schemas and updating references...")
+    spec = apply_renames(spec, rename_map)
     
     print(f"💾 Saving to {output_file}...")
-    with open(output_file, 'w') as f:
-        json.dump(spec, f, indent=2, ensure_ascii=False)
+    # Compact by default: this output feeds the next pipeline stage, so
+    # indentation is pure encoder and parser overhead. --pretty opts back in
+    # for a human-readable artifact.
+    if orjson is not None:
+        # orjson serializes to bytes in C in one shot — no per-value Python
+        # encoder calls, and no str-to-utf8 pass on write
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(spec, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(spec, f, indent=2 if pretty else None,
+                      separators=None if pretty else (',', ':'), ensure_ascii=False)
     
     print(f"✅ Done! Renamed schemas saved to {output_file}")
     print(f"\nSchema name mappings applied:")
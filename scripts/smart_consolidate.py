@@ -13,12 +13,25 @@ Key improvements over basic consolidation:
 """
 
 import copy
+import hashlib
 import json
 import re
 from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Optional
 
 
+def schema_fingerprint(node) -> bytes:
+    """Content hash of a schema subtree (order-insensitive).
+
+    16-byte digest instead of the full canonical JSON string: equal content
+    collapses to one small key, so dedup tables stay compact and comparisons
+    don't re-serialize.
+    """
+    return hashlib.blake2b(
+        json.dumps(node, sort_keys=True).encode(), digest_size=16
+    ).digest()
+
+
 class SchemaStructureAnalyzer:
     """Analyzes schema structure to find duplicates based on attributes"""
     
@@ -124,7 +137,7 @@ class SchemaStructureAnalyzer:
                 - missing_in_1: set - attributes in schema2 but not schema1
                 - missing_in_2: set - attributes in schema1 but not schema2
         """
-        exact = json.dumps(schema1, sort_keys=True) == json.dumps(schema2, sort_keys=True)
+        exact = schema_fingerprint(schema1) == schema_fingerprint(schema2)
         structural = cls.get_structural_signature(schema1) == cls.get_structural_signature(schema2)
         
         attrs1 = cls.get_attribute_set(schema1)
@@ -476,8 +489,7 @@ class SmartConsolidator:
         content_to_names = defaultdict(list)
         
         for name, schema_def in self.schemas.items():
-            content = json.dumps(schema_def, sort_keys=True)
-            content_to_names[content].append(name)
+            content_to_names[schema_fingerprint(schema_def)].append(name)
         
         return {k: v for k, v in content_to_names.items() if len(v) > 1}
     
@@ -670,34 +682,31 @@ class SmartConsolidator:
     
     def apply_consolidation(self, rename_map: Dict[str, str]) -> dict:
         """Apply consolidation to the spec"""
-        new_spec = copy.deepcopy(self.spec)
-        
-        # Update schemas
+        # Rewrite $refs textually: serialize the spec once and substitute the
+        # quoted ref strings with one compiled regex instead of walking every
+        # dict/list node. A quoted "#/components/schemas/<Name>" with a known
+        # old name is unambiguous in an OpenAPI document, so the substitution
+        # is exact. Re-parsing the result also replaces the deepcopy of the
+        # original spec.
+        text = json.dumps(self.spec)
+        if rename_map:
+            pattern = re.compile(
+                r'"#/components/schemas/(' + '|'.join(map(re.escape, rename_map)) + r')"'
+            )
+            text = pattern.sub(
+                lambda m: f'"#/components/schemas/{rename_map[m.group(1)]}"', text
+            )
+        new_spec = json.loads(text)
+
+        # Update schema names (first definition of a canonical name wins)
         new_schemas = {}
         for name, schema_def in new_spec['components']['schemas'].items():
             canonical = rename_map.get(name, name)
             if canonical not in new_schemas:
                 new_schemas[canonical] = schema_def
-        
+
         new_spec['components']['schemas'] = new_schemas
-        
-        # Update all $ref references
-        def update_refs(obj):
-            if isinstance(obj, dict):
-                for key, value in list(obj.items()):
-                    if key == '$ref' and isinstance(value, str):
-                        if value.startswith('#/components/schemas/'):
-                            old_name = value.replace('#/components/schemas/', '')
-                            new_name = rename_map.get(old_name, old_name)
-                            obj[key] = f'#/components/schemas/{new_name}'
-                    else:
-                        update_refs(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    update_refs(item)
-        
-        update_refs(new_spec)
-        
+
         return new_spec
 
 
@@ -714,7 +723,11 @@ class InlineSchemaExtractor:
     """
     
     def __init__(self, spec: dict):
-        self.spec = copy.deepcopy(spec)
+        # Works on the caller's spec directly; extract_inline_schemas
+        # returns the same object. The only caller discards its reference
+        # anyway, so a defensive deepcopy of the multi-MB tree was the
+        # single most expensive operation in this pass.
+        self.spec = spec
         self.schemas = self.spec.get('components', {}).get('schemas', {})
         self.structure_analyzer = SchemaStructureAnalyzer()
     
@@ -1026,9 +1039,9 @@ def fix_nullable_without_type(spec: dict) -> Tuple[dict, int]:
     For empty objects with nullable: true, we use x-ogen-name with {} to make ogen
     generate jx.Raw type which properly handles null values.
     
-    Returns: (spec, count_of_fixed_properties)
+    Modifies spec in place (like the pipeline's other post-processors) and
+    returns it. Returns: (spec, count_of_fixed_properties)
     """
-    spec = copy.deepcopy(spec)
     fixed_count = 0
     
     def is_empty_object(schema: dict) -> bool:
@@ -1111,9 +1124,9 @@ def unify_error_responses(spec: dict) -> Tuple[dict, Dict]:
     Unify duplicate error response schemas (400 BadRequest, 401 Unauthorized, etc.)
     by extracting common inline schemas into shared definitions.
     
-    Returns: (new_spec, stats)
+    Modifies spec in place (like the pipeline's other post-processors) and
+    returns it. Returns: (spec, stats)
     """
-    spec = copy.deepcopy(spec)
     
     # Define common error schemas to extract
     ERROR_SCHEMAS = {